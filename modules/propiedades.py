@@ -187,6 +187,19 @@ def _build_where(texto: Optional[str], filtros: Optional[Dict[str, Any]]) -> tup
     return where, params
 
 
+def accepts(*names: str):
+    """Declara los kwargs que acepta una funcion de consulta.
+
+    La UI filtra contra ``__accepts__`` directamente y se salta la
+    introspeccion con inspect.signature en el camino caliente.
+    """
+    def deco(func):
+        func.__accepts__ = frozenset(names)
+        return func
+    return deco
+
+
+@accepts("page", "page_size", "filtros")
 def listar_propiedades(page: int = 1, page_size: int = 50, filtros: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     conn = _db.get_connection()
     cur = conn.cursor()
@@ -204,6 +217,7 @@ def listar_propiedades(page: int = 1, page_size: int = 50, filtros: Optional[Dic
         conn.close()
 
 
+@accepts("texto", "page", "page_size", "filtros")
 def buscar_propiedades(texto: str, page: int = 1, page_size: int = 50, filtros: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     conn = _db.get_connection()
     cur = conn.cursor()
@@ -221,6 +235,7 @@ def buscar_propiedades(texto: str, page: int = 1, page_size: int = 50, filtros:
         conn.close()
 
 
+@accepts("texto", "filtros")
 def contar_propiedades(texto: Optional[str] = None, filtros: Optional[Dict[str, Any]] = None) -> int:
     conn = _db.get_connection()
     cur = conn.cursor()
@@ -5,25 +5,419 @@ Todos los campos son opcionales; se autocompletan valores minimos para guardar.
 """
 from __future__ import annotations
 
+import json
 import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 import tkinter as tk
 from tkinter import messagebox, ttk
 
 try:
-	from tkcalendar import DateEntry  # type: ignore
+	import orjson  # type: ignore
 except Exception:
-	DateEntry = None  # type: ignore
+	orjson = None  # type: ignore
+
+try:
+	import fastjsonschema  # type: ignore
+except Exception:
+	fastjsonschema = None  # type: ignore
 
 try:
 	from modules import clientes as clientes_module
 except Exception:
 	clientes_module = None
 
+# Referencias resueltas una sola vez al importar (evita hasattr/getattr por guardado)
+_clientes_save = getattr(clientes_module, "save", None)
+_clientes_find_by_curp = getattr(clientes_module, "find_by_curp", None)
+
+
+@lru_cache(maxsize=256)
+def _find_by_curp_cached(curp: str):
+	"""Consulta por CURP con cache: reintentos de Guardar no re-consultan la BD.
+
+	Se invalida con cache_clear() tras cada guardado exitoso.
+	"""
+	return _clientes_find_by_curp(curp)  # type: ignore[misc]
+
 LOG = logging.getLogger(__name__)
 
+# tkcalendar se resuelve perezosamente la primera vez que un tab necesita un
+# DateEntry: su import es caro y ni siquiera se paga si el usuario no abre el
+# tab. NO_TKCALENDAR=1 lo deshabilita y el campo cae a un Entry plano.
+_DATE_ENTRY: Any = None  # None = sin resolver; False = no disponible/deshabilitado
+
+
+def _date_entry_cls() -> Any:
+	global _DATE_ENTRY
+	if _DATE_ENTRY is None:
+		if os.getenv("NO_TKCALENDAR"):
+			_DATE_ENTRY = False
+		else:
+			try:
+				from tkcalendar import DateEntry  # type: ignore
+				_DATE_ENTRY = DateEntry
+			except Exception:
+				_DATE_ENTRY = False
+	return _DATE_ENTRY
+
+# Validadores compilados una sola vez al importar; el match corre en C.
+_PHONE_RE = re.compile(r"\d{10}")
+_CURP_RE = re.compile(r"[A-Z]{4}\d{6}[HM][A-Z]{5}[0-9A-Z]\d")
+_MONEY_RE = re.compile(r"\d+(\.\d+)?")
+
+# Campos con validador propio; solo ellos registran trace de escritura.
+_VALIDATED_KEYS = ("curp", "telefono", "edad", "ingreso_mensual", "presupuesto_min", "presupuesto_max")
+
+# Campos que se normalizan con strip() antes de guardar.
+_STRIP_KEYS = frozenset(("primer_nombre", "segundo_nombre", "apellido_paterno", "apellido_materno", "curp"))
+
+# Enumeraciones de los Combobox: tuplas inmutables construidas una sola vez
+# al importar y compartidas por el esquema y CLIENT_SCHEMA.
+GENEROS = ("Hombre", "Mujer")
+ESTADOS_CIVILES = ("Soltero/a", "Casado/a", "Divorciado/a", "Viudo/a")
+CREDITOS = ("Infonavit", "Fovissste", "Bancario", "Contado")
+SI_NO = ("Si", "No")
+NIVELES_EDUCATIVOS = ("Primaria", "Secundaria", "Preparatoria", "Licenciatura", "Posgrado")
+ORIGENES_CAPTACION = ("Referido", "WhatsApp", "Marketplace", "Otro")
+TIPOS_INTERES = ("Compra", "Renta", "Venta")
+ESTADOS_CLIENTE = ("Prospecto", "Caliente", "Frio", "Cerrado")
+TIPOS_CLIENTE = ("Comprador", "Vendedor", "Arrendador", "Arrendatario")
+ETAPAS_EMBUDO = ("Nuevo", "Contactado", "Visitado", "Negociacion", "Cierre")
+
+# Esquema del registro de cliente; con fastjsonschema instalado se compila
+# una sola vez al importar y _on_guardar lo aplica como cierre sin reflexion.
+# Los campos vienen de Entries/Combos, por lo que todo se valida como cadena
+# (vacia permitida: ningun campo es obligatorio en el formulario). Los enum
+# se construyen desde las tuplas de arriba: agregar un valor al combo lo
+# acepta tambien el validador.
+CLIENT_SCHEMA = {
+	"type": "object",
+	"properties": {
+		"curp": {"type": "string", "pattern": r"^([A-Z]{4}\d{6}[HM][A-Z]{5}[0-9A-Z]\d)?$"},
+		"telefono": {"type": "string", "pattern": r"^(\d{10})?$"},
+		"correo": {"type": "string", "pattern": r"^([^@\s]+@[^@\s]+\.[^@\s]+)?$"},
+		"edad": {"type": "string", "pattern": r"^\d*$"},
+		"genero": {"enum": ["", *GENEROS]},
+		"estado_civil": {"enum": ["", *ESTADOS_CIVILES]},
+		"nivel_educativo": {"enum": ["", *NIVELES_EDUCATIVOS]},
+		"ingreso_mensual": {"type": "string", "pattern": r"^(\d+(\.\d+)?)?$"},
+		"presupuesto_min": {"type": "string", "pattern": r"^(\d+(\.\d+)?)?$"},
+		"presupuesto_max": {"type": "string", "pattern": r"^(\d+(\.\d+)?)?$"},
+	},
+}
+
+if fastjsonschema is not None:
+	_validator = fastjsonschema.compile(CLIENT_SCHEMA)
+else:
+	_validator = None
+
+# Store JSON de pruebas (fallback cuando `modules.clientes` no esta disponible).
+# La ruta se resuelve una sola vez al importar para no recalcular abspath por operacion.
+STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "database", "seeds", "clientes_store.json")
+_STORE_PATH_ABS = os.path.abspath(STORE_PATH)
+_STORE_DIR = os.path.dirname(_STORE_PATH_ABS)
+# JSON compacto en disco (menos bytes por rewrite); exporta
+# CLIENTES_STORE_DEBUG=1 para volver al formato indentado legible.
+_STORE_DEBUG = bool(os.getenv("CLIENTES_STORE_DEBUG"))
+
+
+def _json_loads(raw: bytes) -> Any:
+	# orjson (C) si esta instalado; stdlib como fallback drop-in.
+	if orjson is not None:
+		return orjson.loads(raw)
+	return json.loads(raw)
+
+
+def _json_dumps(data: Any, force_compact: bool = False) -> bytes:
+	if orjson is not None:
+		if _STORE_DEBUG and not force_compact:
+			return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+		return orjson.dumps(data)
+	if _STORE_DEBUG and not force_compact:
+		return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+	return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+try:
+	os.makedirs(_STORE_DIR, exist_ok=True)
+except Exception:
+	pass
+
+
+# Worker unico para la persistencia: el hilo de Tk despacha el guardado y
+# sigue atendiendo eventos mientras el disco (o la BD) trabaja.
+_EXEC = ThreadPoolExecutor(max_workers=1)
+
+# Los registros nuevos se agregan a un apendice JSONL (un write() por alta)
+# y se compactan al .json principal cada _COMPACT_EVERY apendices; asi un
+# alta tipica no paga el rewrite O(N) del archivo completo.
+_STORE_JSONL_ABS = _STORE_PATH_ABS + "l"  # clientes_store.jsonl
+_COMPACT_EVERY = 50
+_append_count = 0
+
+# Cache del store parseado, invalidado por los stats de ambos archivos; evita
+# releer y reparsear todo en cada lookup durante una sesion. Junto a la lista
+# se mantienen un indice {curp: id} para que la verificacion de duplicados sea
+# un probe O(1) en lugar de un scan lineal, y el contador `next_id` persistido
+# para asignar ids sin recorrer todos los registros.
+_STORE_CACHE: Optional[tuple] = None  # (stat_pair, data, curp_index, next_id)
+
+
+def _build_curp_index(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+	return {c["curp"]: c.get("id") for c in data if c.get("curp")}
+
+
+def _stat_pair() -> tuple:
+	def _st(p: str):
+		try:
+			st = os.stat(p)
+			return (st.st_mtime_ns, st.st_size)
+		except OSError:
+			return None
+	return (_st(_STORE_PATH_ABS), _st(_STORE_JSONL_ABS))
+
+
+def _load_store() -> List[Dict[str, Any]]:
+	global _STORE_CACHE
+	key = _stat_pair()
+	if key == (None, None):
+		return []
+	if _STORE_CACHE is not None and _STORE_CACHE[0] == key:
+		return _STORE_CACHE[1]
+	data: List[Dict[str, Any]] = []
+	next_id = 1
+	if key[0] is not None:
+		try:
+			with open(_STORE_PATH_ABS, "rb") as f:
+				raw = _json_loads(f.read())
+			if isinstance(raw, dict):
+				data = raw.get("clientes") or []
+				next_id = int(raw.get("next_id") or 1)
+			else:
+				# Formato viejo (lista plana): migrar en memoria; el proximo
+				# _save_store persiste ya la forma {"next_id", "clientes"}.
+				data = raw
+				next_id = max((int(c.get("id") or 0) for c in data), default=0) + 1
+		except Exception:
+			LOG.exception("Error leyendo store JSON de clientes")
+			data = []
+	if key[1] is not None:
+		try:
+			with open(_STORE_JSONL_ABS, "rb") as f:
+				for line in f:
+					line = line.strip()
+					if line:
+						data.append(_json_loads(line))
+		except Exception:
+			LOG.exception("Error leyendo apendice JSONL de clientes")
+	# Los apendices pueden ir por delante del contador del .json base.
+	for c in data[-_COMPACT_EVERY:] if key[1] is not None else ():
+		cid = int(c.get("id") or 0)
+		if cid >= next_id:
+			next_id = cid + 1
+	_STORE_CACHE = (key, data, _build_curp_index(data), next_id)
+	return data
+
+
+def _curp_index() -> Dict[str, Any]:
+	_load_store()
+	return _STORE_CACHE[2] if _STORE_CACHE is not None else {}
+
+
+def _next_id() -> int:
+	_load_store()
+	return _STORE_CACHE[3] if _STORE_CACHE is not None else 1
+
+
+def _save_store(data: List[Dict[str, Any]], next_id: Optional[int] = None) -> None:
+	# Escritura atomica: tempfile + os.replace evita dejar JSON truncado si
+	# el proceso muere a mitad de escritura (un store corrupto se leeria como []).
+	global _STORE_CACHE
+	if next_id is None:
+		next_id = _STORE_CACHE[3] if _STORE_CACHE is not None else (
+			max((int(c.get("id") or 0) for c in data), default=0) + 1)
+	fd, tmp = tempfile.mkstemp(dir=_STORE_DIR, prefix=".clientes_", suffix=".json")
+	try:
+		# Serializar a bytes primero: json.dump emite muchos write() pequenos
+		# por token; un unico write() amortiza los syscalls.
+		payload = _json_dumps({"next_id": next_id, "clientes": data})
+		with os.fdopen(fd, "wb") as f:
+			f.write(payload)
+		os.replace(tmp, _STORE_PATH_ABS)
+	except Exception:
+		try:
+			os.unlink(tmp)
+		except OSError:
+			pass
+		raise
+	# El .json compactado ya contiene todo; el apendice queda obsoleto.
+	try:
+		os.unlink(_STORE_JSONL_ABS)
+	except OSError:
+		pass
+	_STORE_CACHE = (_stat_pair(), data, _build_curp_index(data), next_id)
+
+
+def _append_record(rec: Dict[str, Any]) -> None:
+	"""Agrega un registro nuevo al apendice JSONL con un solo write()."""
+	global _STORE_CACHE, _append_count
+	data = _load_store()
+	with open(_STORE_JSONL_ABS, "ab") as f:
+		f.write(_json_dumps(rec, force_compact=True) + b"\n")
+	data.append(rec)
+	if _STORE_CACHE is not None:
+		idx, next_id = _STORE_CACHE[2], _STORE_CACHE[3]
+	else:
+		idx, next_id = _build_curp_index(data), 1
+	if rec.get("curp"):
+		idx[rec["curp"]] = rec.get("id")
+	next_id = max(next_id, int(rec.get("id") or 0) + 1)
+	_STORE_CACHE = (_stat_pair(), data, idx, next_id)
+	_append_count += 1
+	if _append_count >= _COMPACT_EVERY:
+		_append_count = 0
+		_save_store(data)
+
+
+def _guardar_en_store(cliente: Dict[str, Any]) -> Dict[str, Any]:
+	data = _load_store()
+	cid = cliente.get("id")
+	if cid is not None:
+		for i, c in enumerate(data):
+			if c.get("id") == cid:
+				data[i] = {**c, **cliente}
+				break
+		else:
+			data.append(cliente)
+		_save_store(data)
+	else:
+		cliente["id"] = _next_id()
+		_append_record(cliente)
+	return cliente
+
+
+
+
+# Normalizadores de _populate a nivel de modulo: sin funciones/celdas nuevas
+# por cada apertura del formulario. Membresia en frozenset: probe O(1).
+# La tabla de traduccion quita acentos en un solo translate() en C, asi los
+# sets solo necesitan las formas ASCII ("sí" -> "si").
+_NORM = str.maketrans({"á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u",
+	"Á": "a", "É": "e", "Í": "i", "Ó": "o", "Ú": "u"})
+_TRUE = frozenset(("true", "1", "si"))
+_FALSE = frozenset(("false", "0", "no"))
+
+
+def _v(val: Any) -> str:
+	if val is None:
+		return ""
+	s = str(val)
+	return "" if s.lower() == "none" else s
+
+
+def _v_bool(val: Any) -> str:
+	if val is True:
+		return "Si"
+	if val is False:
+		return "No"
+	s = str(val).strip().lower().translate(_NORM)
+	if s in _TRUE:
+		return "Si"
+	if s in _FALSE:
+		return "No"
+	return _v(val)
+
+
+def _interes_val(g: Any, key: str) -> Any:
+	"""Valor de propiedad-interes aceptando el alias historico interes_*."""
+	val = g(key)
+	if val is None and key.startswith("pi_"):
+		val = g("interes_" + key[3:])
+	return val
+
+# Esquema de campos del formulario: una seccion por tupla, consumida por
+# `_build_section`. Cada campo es (key, etiqueta, tipo, valores) con tipo en
+# {"entry", "combo", "date", "header"}; los "header" solo insertan subtitulo.
+# Una seccion con titulo None se construye a continuacion, en el mismo tab
+# que la seccion anterior.
+_FORM_SECTIONS = (
+	("personal", "Personal", (
+		("primer_nombre", "Primer nombre", "entry", None),
+		("segundo_nombre", "Segundo nombre", "entry", None),
+		("apellido_paterno", "Apellido paterno", "entry", None),
+		("apellido_materno", "Apellido materno", "entry", None),
+		("curp", "CURP", "entry", None),
+		("fecha_nacimiento", "Fecha de nacimiento (YYYY-MM-DD)", "date", None),
+		("edad", "Edad", "entry", None),
+		("genero", "Genero", "combo", GENEROS),
+		("estado_civil", "Estado civil", "combo", ESTADOS_CIVILES),
+		(None, "Metodo de contacto", "header", None),
+		("telefono", "Telefono", "entry", None),
+		("correo", "Correo", "entry", None),
+		(None, "Residencia", "header", None),
+		("pais", "Pais", "entry", None),
+		("estado", "Estado", "entry", None),
+		("ciudad", "Ciudad", "entry", None),
+		("zona", "Zona", "entry", None),
+	)),
+	("laboral", "Laboral", (
+		("ocupacion", "Ocupacion", "entry", None),
+		("antiguedad_laboral", "Antiguedad laboral", "entry", None),
+	)),
+	("financiero", "Financiero", (
+		("ingreso_mensual", "Ingreso x mes", "entry", None),
+		("tipo_credito", "Tipo de credito disponible", "combo", CREDITOS),
+		("buro_credito", "Buro de credito", "combo", SI_NO),
+		(None, "Presupuesto", "header", None),
+		("presupuesto_min", "Minimo", "entry", None),
+		("presupuesto_max", "Maximo", "entry", None),
+	)),
+	("academico", "Academico", (
+		("nivel_educativo", "Nivel educativo", "combo", NIVELES_EDUCATIVOS),
+	)),
+	("familiar", "Familiar", (
+		("hijos", "Hijos", "entry", None),
+	)),
+	("captacion", "Captacion", (
+		("origen_captacion", "Origen de captacion", "combo", ORIGENES_CAPTACION),
+	)),
+	("prop_interes", "Propiedad Interes", (
+		("pi_pais", "Pais", "entry", None),
+		("pi_estado", "Estado", "entry", None),
+		("pi_ciudad", "Ciudad", "entry", None),
+		("pi_zona", "Zona", "entry", None),
+		("pi_tipo", "Tipo de interes (compra/renta/venta)", "combo", TIPOS_INTERES),
+		("zona_interes", "Zona de interes (mapa de calor)", "entry", None),
+	)),
+	("historial", "Historial", (
+		("deudor_alimenticio", "Deudor alimenticio", "combo", SI_NO),
+		("propiedades_previas", "Propiedades previas (si/no)", "combo", SI_NO),
+		("num_propiedades_previas", "N° de propiedades previas", "entry", None),
+		("edad_adquisicion", "Edad de adquisicion", "entry", None),
+	)),
+	("stats", None, (
+		(None, "Estadisticas", "header", None),
+		("estado_cliente", "Estado cliente", "combo", ESTADOS_CLIENTE),
+		("tipo_cliente", "Tipo cliente", "combo", TIPOS_CLIENTE),
+		("etapa_embudo", "Etapa embudo", "combo", ETAPAS_EMBUDO),
+	)),
+)
+
+# Claves de campo derivadas del esquema, en orden de declaracion; todas las
+# vars viven en el dict plano `self.vars` (las claves son unicas entre tabs).
+FIELD_KEYS = tuple(
+	k
+	for _name, _tab, fields in _FORM_SECTIONS
+	for k, _label, _kind, _values in fields
+	if k is not None
+)
 
 
 class ClienteForm(tk.Toplevel):
@@ -37,317 +431,182 @@ class ClienteForm(tk.Toplevel):
 		self.resizable(True, True)
 		self.geometry("900x700")
 
+		# Dialogo reutilizable: en lugar de destruirse al cerrar se oculta y
+		# el caller espera `_cerrado` (wait_variable); el arbol de widgets se
+		# construye una sola vez por sesion.
+		self._reusable = False
+		self._cerrado = tk.BooleanVar(master=self, value=False)
+		self.protocol("WM_DELETE_WINDOW", self._on_cerrar)
+		# Guardado en vuelo: bloquea reenvios mientras el worker persiste.
+		self._saving = False
+
+		# Ventana oculta mientras se construye y puebla: los ~40 .set() de un
+		# edit no disparan redraws parciales; se mapea ya con todo listo.
+		self.withdraw()
+		self._init_vars()
 		self._build_ui()
 		if self.mode == "editar":
 			self._populate()
+		self.update_idletasks()
+		self.deiconify()
+
+	def _init_vars(self) -> None:
+		"""Crea todas las StringVars del esquema de una vez.
+
+		Las vars son baratas comparadas con los widgets; tenerlas desde el
+		inicio permite poblar y guardar aunque un tab aun no se construya.
+		"""
+		# Un dict plano clave -> StringVar en lugar de nueve dicts por seccion:
+		# sin despacho por seccion ni defaults defensivos en los accesos.
+		self.vars: Dict[str, Any] = {}
+		# Metodos .get ya resueltos por campo: _on_guardar los invoca directo
+		# sin pagar el lookup de atributo sobre cada StringVar.
+		self._getters: Dict[str, Any] = {}
+		for key in FIELD_KEYS:
+			var = tk.StringVar(master=self)
+			self.vars[key] = var
+			self._getters[key] = var.get
+		# Bit de "campo tocado": un formulario sin editar no paga ningun
+		# round-trip .get() a Tcl durante la cadena de validacion.
+		self._dirty: set = set()
+		for key in _VALIDATED_KEYS:
+			self.vars[key].trace_add("write", lambda *_args, _k=key: self._dirty.add(_k))
 
 	def _build_ui(self) -> None:
 		frm = ttk.Frame(self, padding=12)
 		frm.pack(fill=tk.BOTH, expand=True)
 
+		# Fuente de encabezados registrada una vez como estilo con nombre;
+		# Tk cachea la fuente y cada header evita re-resolverla.
+		style = ttk.Style(self)
+		style.configure("Section.TLabel", font=("Segoe UI", 10, "bold"))
+
 		self.notebook = ttk.Notebook(frm)
 		self.notebook.pack(fill=tk.BOTH, expand=True)
 
-		# Tabs
-		self.tab_personal = ttk.Frame(self.notebook)
-		self.tab_laboral = ttk.Frame(self.notebook)
-		self.tab_financiero = ttk.Frame(self.notebook)
-		self.tab_academico = ttk.Frame(self.notebook)
-		self.tab_familiar = ttk.Frame(self.notebook)
-		self.tab_captacion = ttk.Frame(self.notebook)
-		self.tab_prop_interes = ttk.Frame(self.notebook)
-		self.tab_historial = ttk.Frame(self.notebook)
-
-		self.notebook.add(self.tab_personal, text="Personal")
-		self.notebook.add(self.tab_laboral, text="Laboral")
-		self.notebook.add(self.tab_financiero, text="Financiero")
-		self.notebook.add(self.tab_academico, text="Academico")
-		self.notebook.add(self.tab_familiar, text="Familiar")
-		self.notebook.add(self.tab_captacion, text="Captacion")
-		self.notebook.add(self.tab_prop_interes, text="Propiedad Interes")
-		self.notebook.add(self.tab_historial, text="Historial")
-
-		self._build_personal(self.tab_personal)
-		self._build_laboral(self.tab_laboral)
-		self._build_financiero(self.tab_financiero)
-		self._build_academico(self.tab_academico)
-		self._build_familiar(self.tab_familiar)
-		self._build_captacion(self.tab_captacion)
-		self._build_prop_interes(self.tab_prop_interes)
-		self._build_historial(self.tab_historial)
-		self._build_estadisticas(self.tab_historial)
+		# Tabs desde el esquema declarativo. Solo el tab visible construye sus
+		# widgets; el resto se difiere a la primera seleccion para abaratar la
+		# apertura del modal (<<NotebookTabChanged>>).
+		self._tab_sections: Dict[str, list] = {}
+		self._built_tabs: set = set()
+		parent = None
+		for name, tab_title, fields in _FORM_SECTIONS:
+			if tab_title is not None:
+				parent = ttk.Frame(self.notebook)
+				self.notebook.add(parent, text=tab_title)
+				setattr(self, "tab_" + name, parent)
+				self._tab_sections[str(parent)] = []
+			self._tab_sections[str(parent)].append(fields)
+		self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+		self._build_tab(self.tab_personal)
+		if __debug__:
+			# _init_vars garantiza todas las claves del esquema; el resto del
+			# modulo indexa directo sin defaults.
+			assert set(FIELD_KEYS) <= set(self.vars)
 
 		# Botones
 		btn_frame = ttk.Frame(frm)
 		btn_frame.pack(fill=tk.X, pady=(10, 0))
-		ttk.Button(btn_frame, text="Guardar", command=self._on_guardar).pack(side=tk.RIGHT, padx=6)
+		self.btn_guardar = ttk.Button(btn_frame, text="Guardar", command=self._on_guardar)
+		self.btn_guardar.pack(side=tk.RIGHT, padx=6)
 		ttk.Button(btn_frame, text="Limpiar", command=self._on_limpiar).pack(side=tk.RIGHT)
-		ttk.Button(btn_frame, text="Cancelar", command=self.destroy).pack(side=tk.RIGHT, padx=6)
-
-	def _build_personal(self, parent: ttk.Frame) -> None:
-		self.vars_personal: Dict[str, tk.StringVar] = {}
+		ttk.Button(btn_frame, text="Cancelar", command=self._on_cerrar).pack(side=tk.RIGHT, padx=6)
 
+	def _build_tab(self, tab: ttk.Frame) -> None:
+		key = str(tab)
+		if key in self._built_tabs:
+			return
+		self._built_tabs.add(key)
 		row = 0
-		def _add(label: str, key: str, widget: str = "entry", values: Optional[list[str]] = None) -> None:
-			nonlocal row
-			ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_personal[key] = tk.StringVar()
-			if widget == "combo":
-				cb = ttk.Combobox(parent, textvariable=self.vars_personal[key], state="readonly")
-				cb["values"] = values or []
-				cb.grid(row=row, column=1, sticky=tk.EW, padx=6)
-			elif widget == "date":
-				if DateEntry:
-					entry = DateEntry(parent, date_pattern="yyyy-mm-dd")  # type: ignore
-					entry.grid(row=row, column=1, sticky=tk.EW, padx=6)  # type: ignore
-					self.vars_personal[key + "__widget"] = entry
-				else:
-					ttk.Entry(parent, textvariable=self.vars_personal[key]).grid(row=row, column=1, sticky=tk.EW, padx=6)
-			else:
-				ttk.Entry(parent, textvariable=self.vars_personal[key]).grid(row=row, column=1, sticky=tk.EW, padx=6)
-			row += 1
-
-		_add("Primer nombre", "primer_nombre")
-		_add("Segundo nombre", "segundo_nombre")
-		_add("Apellido paterno", "apellido_paterno")
-		_add("Apellido materno", "apellido_materno")
-		_add("CURP", "curp")
-		_add("Fecha de nacimiento (YYYY-MM-DD)", "fecha_nacimiento", widget="date")
-		_add("Edad", "edad")
-		_add("Genero", "genero", widget="combo", values=["Hombre", "Mujer"])
-		_add("Estado civil", "estado_civil", widget="combo", values=["Soltero/a", "Casado/a", "Divorciado/a", "Viudo/a"])
-
-		# Metodo de contacto
-		ttk.Label(parent, text="Metodo de contacto", font=("Segoe UI", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=6, pady=(12, 4))
-		row += 1
-		_add("Telefono", "telefono")
-		_add("Correo", "correo")
-
-		# Residencia
-		ttk.Label(parent, text="Residencia", font=("Segoe UI", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=6, pady=(12, 4))
-		row += 1
-		_add("Pais", "pais")
-		_add("Estado", "estado")
-		_add("Ciudad", "ciudad")
-		_add("Zona", "zona")
+		for fields in self._tab_sections[key]:
+			row = self._build_section(tab, fields, row)
 
-		parent.columnconfigure(1, weight=1)
-
-	def _build_laboral(self, parent: ttk.Frame) -> None:
-		self.vars_laboral: Dict[str, tk.StringVar] = {}
-		labels = [
-			("Ocupacion", "ocupacion"),
-			("Antiguedad laboral", "antiguedad_laboral"),
-		]
-		for i, (label, key) in enumerate(labels):
-			ttk.Label(parent, text=label).grid(row=i, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_laboral[key] = tk.StringVar()
-			ttk.Entry(parent, textvariable=self.vars_laboral[key]).grid(row=i, column=1, sticky=tk.EW, padx=6)
-		parent.columnconfigure(1, weight=1)
-
-	def _build_financiero(self, parent: ttk.Frame) -> None:
-		self.vars_financiero: Dict[str, tk.StringVar] = {}
-		labels = [
-			("Ingreso x mes", "ingreso_mensual"),
-			("Tipo de credito disponible", "tipo_credito"),
-			("Buro de credito", "buro_credito"),
-		]
-		row = 0
-		for label, key in labels:
-			ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_financiero[key] = tk.StringVar()
-			if key == "tipo_credito":
-				cb = ttk.Combobox(parent, textvariable=self.vars_financiero[key], state="readonly")
-				cb["values"] = ["Infonavit", "Fovissste", "Bancario", "Contado"]
-				cb.grid(row=row, column=1, sticky=tk.EW, padx=6)
-			elif key == "buro_credito":
-				cb = ttk.Combobox(parent, textvariable=self.vars_financiero[key], state="readonly")
-				cb["values"] = ["Si", "No"]
-				cb.grid(row=row, column=1, sticky=tk.EW, padx=6)
+	def _on_tab_changed(self, event: Any) -> None:
+		try:
+			self._build_tab(self.nametowidget(self.notebook.select()))
+		except Exception:
+			LOG.exception("Error construyendo tab seleccionado")
+
+	def _build_section(self, parent: ttk.Frame, fields: tuple, start_row: int) -> int:
+		"""Construye los widgets de una seccion del esquema sobre sus vars ya creadas."""
+		vars_d: Dict[str, Any] = self.vars
+		# Constructores y constantes como locales: este loop corre una vez por
+		# widget y los lookups de modulo/atributo se pagan una sola vez.
+		Label, Combobox, Entry = ttk.Label, ttk.Combobox, ttk.Entry
+		row = start_row
+		# Los `grid` se acumulan como script Tcl y se emiten en un solo eval:
+		# un round-trip Python->Tcl por seccion en lugar de uno por widget.
+		grid_lines: List[str] = []
+		add_grid = grid_lines.append
+		for key, label, kind, values in fields:
+			if kind == "header":
+				w = Label(parent, text=label, style="Section.TLabel")
+				add_grid(f"grid {w} -row {row} -column 0 -sticky w -padx 6 -pady {{12 4}}")
+				row += 1
+				continue
+			w = Label(parent, text=label)
+			add_grid(f"grid {w} -row {row} -column 0 -sticky w -padx 6 -pady 4")
+			var = vars_d[key]
+			if kind == "combo":
+				cb = Combobox(parent, textvariable=var, state="readonly")
+				cb["values"] = values
+				add_grid(f"grid {cb} -row {row} -column 1 -sticky ew -padx 6")
+			elif kind == "date" and _date_entry_cls():
+				entry = _DATE_ENTRY(parent, date_pattern="yyyy-mm-dd")
+				add_grid(f"grid {entry} -row {row} -column 1 -sticky ew -padx 6")
+				vars_d[key + "__widget"] = entry
+				# Si _populate corrio antes de construir este tab, el valor
+				# quedo en la var; reflejarlo en el widget recien creado.
+				try:
+					if var.get():
+						entry.set_date(var.get())  # type: ignore
+				except Exception:
+					pass
 			else:
-				ttk.Entry(parent, textvariable=self.vars_financiero[key]).grid(row=row, column=1, sticky=tk.EW, padx=6)
-			row += 1
-
-		ttk.Label(parent, text="Presupuesto", font=("Segoe UI", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=6, pady=(12, 4))
-		row += 1
-		for label, key in [("Minimo", "presupuesto_min"), ("Maximo", "presupuesto_max")]:
-			ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_financiero[key] = tk.StringVar()
-			ttk.Entry(parent, textvariable=self.vars_financiero[key]).grid(row=row, column=1, sticky=tk.EW, padx=6)
+				add_grid(f"grid {Entry(parent, textvariable=var)} -row {row} -column 1 -sticky ew -padx 6")
 			row += 1
-
-		parent.columnconfigure(1, weight=1)
-
-	def _build_academico(self, parent: ttk.Frame) -> None:
-		self.vars_academico: Dict[str, tk.StringVar] = {}
-		ttk.Label(parent, text="Nivel educativo").grid(row=0, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_academico["nivel_educativo"] = tk.StringVar()
-		cb = ttk.Combobox(parent, textvariable=self.vars_academico["nivel_educativo"], state="readonly")
-		cb["values"] = ["Primaria", "Secundaria", "Preparatoria", "Licenciatura", "Posgrado"]
-		cb.grid(row=0, column=1, sticky=tk.EW, padx=6)
-		parent.columnconfigure(1, weight=1)
-
-	def _build_familiar(self, parent: ttk.Frame) -> None:
-		self.vars_familiar: Dict[str, tk.StringVar] = {}
-		ttk.Label(parent, text="Hijos").grid(row=0, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_familiar["hijos"] = tk.StringVar()
-		ttk.Entry(parent, textvariable=self.vars_familiar["hijos"]).grid(row=0, column=1, sticky=tk.EW, padx=6)
+		parent.tk.eval("\n".join(grid_lines))
 		parent.columnconfigure(1, weight=1)
+		return row
+
+	# Claves que se pueblan con copia directa; los campos con tratamiento
+	# especial (fecha, pi_*, booleanos) van aparte.
+	_POPULATE_KEYS = (
+		"primer_nombre", "segundo_nombre", "apellido_paterno", "apellido_materno",
+		"curp", "edad", "genero", "estado_civil", "telefono", "correo",
+		"pais", "estado", "ciudad", "zona",
+		"ocupacion", "antiguedad_laboral",
+		"ingreso_mensual", "tipo_credito", "buro_credito", "presupuesto_min", "presupuesto_max",
+		"nivel_educativo", "hijos", "origen_captacion",
+		"num_propiedades_previas", "edad_adquisicion",
+		"estado_cliente", "tipo_cliente", "etapa_embudo",
+	)
 
-	def _build_captacion(self, parent: ttk.Frame) -> None:
-		self.vars_captacion: Dict[str, tk.StringVar] = {}
-		origenes = ["Referido", "WhatsApp", "Marketplace", "Otro"]
-		ttk.Label(parent, text="Origen de captacion").grid(row=0, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_captacion["origen_captacion"] = tk.StringVar()
-		cb2 = ttk.Combobox(parent, textvariable=self.vars_captacion["origen_captacion"], state="readonly")
-		cb2["values"] = origenes
-		cb2.grid(row=0, column=1, sticky=tk.EW, padx=6)
-		parent.columnconfigure(1, weight=1)
-
-	def _build_prop_interes(self, parent: ttk.Frame) -> None:
-		self.vars_prop_interes: Dict[str, tk.StringVar] = {}
-		labels = [
-			("Pais", "pi_pais"),
-			("Estado", "pi_estado"),
-			("Ciudad", "pi_ciudad"),
-			("Zona", "pi_zona"),
-			("Tipo de interes (compra/renta/venta)", "pi_tipo"),
-			("Zona de interes (mapa de calor)", "zona_interes"),
-		]
-		for i, (label, key) in enumerate(labels):
-			ttk.Label(parent, text=label).grid(row=i, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_prop_interes[key] = tk.StringVar()
-			if key == "pi_tipo":
-				cb = ttk.Combobox(parent, textvariable=self.vars_prop_interes[key], state="readonly")
-				cb["values"] = ["Compra", "Renta", "Venta"]
-				cb.grid(row=i, column=1, sticky=tk.EW, padx=6)
-			else:
-				ttk.Entry(parent, textvariable=self.vars_prop_interes[key]).grid(row=i, column=1, sticky=tk.EW, padx=6)
-		parent.columnconfigure(1, weight=1)
+	def _populate(self) -> None:
+		p = self.cliente
+		if not p:
+			return
+		# Metodo bound resuelto una vez: ~35 lookups de atributo menos por carga.
+		g = p.get
+		try:
+			v = self.vars
+			for key in self._POPULATE_KEYS:
+				v[key].set(_v(g(key)))
 
-	def _build_historial(self, parent: ttk.Frame) -> None:
-		self.vars_historial: Dict[str, tk.StringVar] = {}
-		labels = [
-			("Deudor alimenticio", "deudor_alimenticio"),
-			("Propiedades previas (si/no)", "propiedades_previas"),
-			("N° de propiedades previas", "num_propiedades_previas"),
-			("Edad de adquisicion", "edad_adquisicion"),
-		]
-		for i, (label, key) in enumerate(labels):
-			ttk.Label(parent, text=label).grid(row=i, column=0, sticky=tk.W, padx=6, pady=4)
-			self.vars_historial[key] = tk.StringVar()
-			if key in ("deudor_alimenticio", "propiedades_previas"):
-				cb = ttk.Combobox(parent, textvariable=self.vars_historial[key], state="readonly")
-				cb["values"] = ["Si", "No"]
-				cb.grid(row=i, column=1, sticky=tk.EW, padx=6)
-			else:
-				ttk.Entry(parent, textvariable=self.vars_historial[key]).grid(row=i, column=1, sticky=tk.EW, padx=6)
-		parent.columnconfigure(1, weight=1)
+			self._set_fecha_nacimiento(g("fecha_nacimiento"))
 
-	def _build_estadisticas(self, parent: ttk.Frame) -> None:
-		"""Campos para estadisticas y segmentacion."""
-		self.vars_stats: Dict[str, tk.StringVar] = {}
-		row = 5
-		ttk.Label(parent, text="Estadisticas", font=("Segoe UI", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=6, pady=(12, 4))
-		row += 1
-
-		ttk.Label(parent, text="Estado cliente").grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_stats["estado_cliente"] = tk.StringVar()
-		cb_estado = ttk.Combobox(parent, textvariable=self.vars_stats["estado_cliente"], state="readonly")
-		cb_estado["values"] = ["Prospecto", "Caliente", "Frio", "Cerrado"]
-		cb_estado.grid(row=row, column=1, sticky=tk.EW, padx=6)
-		row += 1
-
-		ttk.Label(parent, text="Tipo cliente").grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_stats["tipo_cliente"] = tk.StringVar()
-		cb_tipo = ttk.Combobox(parent, textvariable=self.vars_stats["tipo_cliente"], state="readonly")
-		cb_tipo["values"] = ["Comprador", "Vendedor", "Arrendador", "Arrendatario"]
-		cb_tipo.grid(row=row, column=1, sticky=tk.EW, padx=6)
-		row += 1
-
-		ttk.Label(parent, text="Etapa embudo").grid(row=row, column=0, sticky=tk.W, padx=6, pady=4)
-		self.vars_stats["etapa_embudo"] = tk.StringVar()
-		cb_etapa = ttk.Combobox(parent, textvariable=self.vars_stats["etapa_embudo"], state="readonly")
-		cb_etapa["values"] = ["Nuevo", "Contactado", "Visitado", "Negociacion", "Cierre"]
-		cb_etapa.grid(row=row, column=1, sticky=tk.EW, padx=6)
-		row += 1
+			# propiedad interes (acepta alias interes_*)
+			for key in ("pi_pais", "pi_estado", "pi_ciudad", "pi_zona", "pi_tipo", "zona_interes"):
+				v[key].set(_v(_interes_val(g, key)))
 
-	def _populate(self) -> None:
-		try:
-			p = self.cliente
-			if not p:
-				return
-			def _v(val: Any) -> str:
-				if val is None:
-					return ""
-				s = str(val)
-				return "" if s.lower() == "none" else s
-			def _v_bool(val: Any) -> str:
-				if val is True or str(val).strip().lower() in ("true", "1", "si", "sí"):
-					return "Si"
-				if val is False or str(val).strip().lower() in ("false", "0", "no"):
-					return "No"
-				return _v(val)
-			def _interes_val(key: str) -> Any:
-				val = p.get(key)
-				if val is None and key.startswith("pi_"):
-					alt = "interes_" + key[3:]
-					val = p.get(alt)
-				return val
-			# personal
-			self.vars_personal.get("primer_nombre", tk.StringVar()).set(_v(p.get("primer_nombre")))
-			self.vars_personal.get("segundo_nombre", tk.StringVar()).set(_v(p.get("segundo_nombre")))
-			self.vars_personal.get("apellido_paterno", tk.StringVar()).set(_v(p.get("apellido_paterno")))
-			self.vars_personal.get("apellido_materno", tk.StringVar()).set(_v(p.get("apellido_materno")))
-			self.vars_personal.get("curp", tk.StringVar()).set(_v(p.get("curp")))
-			self._set_fecha_nacimiento(p.get("fecha_nacimiento"))
-			self.vars_personal.get("edad", tk.StringVar()).set(_v(p.get("edad")))
-			self.vars_personal.get("genero", tk.StringVar()).set(_v(p.get("genero")))
-			self.vars_personal.get("estado_civil", tk.StringVar()).set(_v(p.get("estado_civil")))
-			self.vars_personal.get("telefono", tk.StringVar()).set(_v(p.get("telefono")))
-			self.vars_personal.get("correo", tk.StringVar()).set(_v(p.get("correo")))
-			self.vars_personal.get("pais", tk.StringVar()).set(_v(p.get("pais")))
-			self.vars_personal.get("estado", tk.StringVar()).set(_v(p.get("estado")))
-			self.vars_personal.get("ciudad", tk.StringVar()).set(_v(p.get("ciudad")))
-			self.vars_personal.get("zona", tk.StringVar()).set(_v(p.get("zona")))
-
-			# laboral
-			self.vars_laboral.get("ocupacion", tk.StringVar()).set(_v(p.get("ocupacion")))
-			self.vars_laboral.get("antiguedad_laboral", tk.StringVar()).set(_v(p.get("antiguedad_laboral")))
-
-			# financiero
-			for key in ["ingreso_mensual", "tipo_credito", "buro_credito", "presupuesto_min", "presupuesto_max"]:
-				self.vars_financiero.get(key, tk.StringVar()).set(_v(p.get(key)))
-
-			# academico
-			self.vars_academico.get("nivel_educativo", tk.StringVar()).set(_v(p.get("nivel_educativo")))
-
-			# familiar
-			self.vars_familiar.get("hijos", tk.StringVar()).set(_v(p.get("hijos")))
-
-			# captacion
-			self.vars_captacion.get("origen_captacion", tk.StringVar()).set(_v(p.get("origen_captacion")))
-
-			# propiedad interes
-			for key in ["pi_pais", "pi_estado", "pi_ciudad", "pi_zona", "pi_tipo", "zona_interes"]:
-				self.vars_prop_interes.get(key, tk.StringVar()).set(_v(_interes_val(key)))
-
-			# historial
-			self.vars_historial.get("deudor_alimenticio", tk.StringVar()).set(_v_bool(p.get("deudor_alimenticio")))
-			self.vars_historial.get("propiedades_previas", tk.StringVar()).set(_v_bool(p.get("propiedades_previas")))
-			self.vars_historial.get("num_propiedades_previas", tk.StringVar()).set(_v(p.get("num_propiedades_previas")))
-			self.vars_historial.get("edad_adquisicion", tk.StringVar()).set(_v(p.get("edad_adquisicion")))
-
-			# stats
-			if hasattr(self, "vars_stats"):
-				self.vars_stats.get("estado_cliente", tk.StringVar()).set(_v(p.get("estado_cliente")))
-				self.vars_stats.get("tipo_cliente", tk.StringVar()).set(_v(p.get("tipo_cliente")))
-				self.vars_stats.get("etapa_embudo", tk.StringVar()).set(_v(p.get("etapa_embudo")))
+			# historial (booleanos normalizados a Si/No)
+			for key in ("deudor_alimenticio", "propiedades_previas"):
+				v[key].set(_v_bool(g(key)))
 		except Exception:
 			LOG.exception("Error poblando formulario de cliente")
 
 	def _set_fecha_nacimiento(self, value: Any) -> None:
-		widget = self.vars_personal.get("fecha_nacimiento__widget")
+		widget = self.vars.get("fecha_nacimiento__widget")
 		if value is None or str(value).lower() == "none":
 			value = ""
 		if widget:
@@ -359,50 +618,54 @@ class ClienteForm(tk.Toplevel):
 			except Exception:
 				pass
 		else:
-			self.vars_personal.get("fecha_nacimiento", tk.StringVar()).set(value or "")
+			self.vars["fecha_nacimiento"].set(value or "")
 
 	def _get_fecha_nacimiento(self) -> str:
-		widget = self.vars_personal.get("fecha_nacimiento__widget")
+		widget = self.vars.get("fecha_nacimiento__widget")
 		if widget:
 			try:
 				val = widget.get()  # type: ignore
 				return str(val).strip()
 			except Exception:
 				return ""
-		return self.vars_personal.get("fecha_nacimiento", tk.StringVar()).get().strip()
+		return self.vars["fecha_nacimiento"].get().strip()
 
 	def _on_limpiar(self) -> None:
-		for d in (
-			self.vars_personal,
-			self.vars_laboral,
-			self.vars_financiero,
-			self.vars_academico,
-			self.vars_familiar,
-			self.vars_captacion,
-			self.vars_prop_interes,
-			self.vars_historial,
-		):
-			for v in d.values():
-				try:
-					v.set("")
-				except Exception:
-					pass
-		if hasattr(self, "vars_stats"):
-			for v in self.vars_stats.values():
-				try:
-					v.set("")
-				except Exception:
-					pass
+		# Las entradas *__widget guardan widgets (DateEntry), no StringVars.
+		# Un solo tk.eval con todos los `set` limpia ~40 variables en un unico
+		# cruce Python->Tcl en lugar de un .set("") por variable.
+		script = "\n".join(
+			'set {%s} ""' % v._name
+			for key, v in self.vars.items()
+			if not key.endswith("__widget")
+		)
+		self.tk.eval(script)
 		self._set_fecha_nacimiento("")
 
+	def reset(self, mode: str = "crear", cliente: Optional[Dict[str, Any]] = None) -> None:
+		"""Reconfigura un dialogo reutilizable para un nuevo alta/edicion."""
+		self.mode = mode
+		self.cliente = cliente or {}
+		self.title("Cliente - " + ("Crear" if mode == "crear" else "Editar"))
+		self._on_limpiar()
+		self._dirty.clear()
+		if mode == "editar":
+			self._populate()
+
 	def _validar_telefonos(self) -> Optional[str]:
-		val = self.vars_personal.get("telefono", tk.StringVar()).get().strip()
-		if val and (not val.isdigit() or len(val) != 10):
+		if "telefono" not in self._dirty:
+			return None
+		val = self.vars["telefono"].get().strip()
+		# len() es O(1); corta antes de pagar el scan del regex cuando la
+		# longitud ya descarta el valor (el caso de error mas comun).
+		if val and (len(val) != 10 or not _PHONE_RE.fullmatch(val)):
 			return "El telefono debe tener 10 digitos numericos."
 		return None
 
 	def _validar_edad(self) -> Optional[str]:
-		val = self.vars_personal.get("edad", tk.StringVar()).get().strip()
+		if "edad" not in self._dirty:
+			return None
+		val = self.vars["edad"].get().strip()
 		if not val:
 			return None
 		if not val.isdigit():
@@ -410,129 +673,146 @@ class ClienteForm(tk.Toplevel):
 		return None
 
 	def _validar_montos(self) -> Optional[str]:
-		def _to_float(v: str) -> Optional[float]:
-			if not v:
-				return None
-			try:
-				return float(v)
-			except Exception:
-				return None
-
-		ingreso = self.vars_financiero.get("ingreso_mensual", tk.StringVar()).get().strip()
-		pmin = self.vars_financiero.get("presupuesto_min", tk.StringVar()).get().strip()
-		pmax = self.vars_financiero.get("presupuesto_max", tk.StringVar()).get().strip()
+		if self._dirty.isdisjoint(("ingreso_mensual", "presupuesto_min", "presupuesto_max")):
+			return None
+		# Validez por regex (un match en C, sin try/except); float() solo corre
+		# sobre valores ya validados para la comparacion min/max.
+		ingreso = self.vars["ingreso_mensual"].get().strip()
+		pmin = self.vars["presupuesto_min"].get().strip()
+		pmax = self.vars["presupuesto_max"].get().strip()
 
-		if ingreso and _to_float(ingreso) is None:
+		if ingreso and not _MONEY_RE.fullmatch(ingreso):
 			return "Ingreso mensual debe ser numerico."
-		if pmin and _to_float(pmin) is None:
+		if pmin and not _MONEY_RE.fullmatch(pmin):
 			return "Presupuesto minimo debe ser numerico."
-		if pmax and _to_float(pmax) is None:
+		if pmax and not _MONEY_RE.fullmatch(pmax):
 			return "Presupuesto maximo debe ser numerico."
-		if pmin and pmax:
-			min_val = _to_float(pmin)
-			max_val = _to_float(pmax)
-			if min_val is not None and max_val is not None and min_val > max_val:
-				return "Presupuesto minimo no puede ser mayor al maximo."
+		if pmin and pmax and float(pmin) > float(pmax):
+			return "Presupuesto minimo no puede ser mayor al maximo."
 		return None
 
 	def _validar_curp(self) -> Optional[str]:
-		curp = self.vars_personal.get("curp", tk.StringVar()).get().strip()
+		if "curp" not in self._dirty:
+			return None
+		curp = self.vars["curp"].get().strip()
 		if not curp:
 			return None
-		if len(curp) != 18:
-			return "CURP invalido (debe tener 18 caracteres)."
+		if not _CURP_RE.fullmatch(curp.upper()):
+			return "CURP invalido (18 caracteres con formato oficial)."
 		return None
 
 	def _existe_por_curp(self, curp: str) -> bool:
 		try:
-			if clientes_module and hasattr(clientes_module, "find_by_curp"):
-				found = clientes_module.find_by_curp(curp)  # type: ignore
+			if _clientes_find_by_curp:
+				found = _find_by_curp_cached(curp)
 				if not found:
 					return False
-				if self.mode == "editar" and self.cliente.get("id") is not None:
-					return int(found.get("id", 0)) != int(self.cliente.get("id"))
-				return True
+				found_id = found.get("id", 0)
+			else:
+				idx = _curp_index()
+				if curp not in idx:
+					return False
+				found_id = idx[curp] or 0
+			if self.mode == "editar" and self.cliente.get("id") is not None:
+				return int(found_id) != int(self.cliente.get("id"))
+			return True
 		except Exception:
-			LOG.exception("Error consultando modules.clientes.find_by_curp")
+			LOG.exception("Error consultando cliente por CURP")
 		return False
 
 	def _on_guardar(self) -> None:
+		# Con el guardado asincrono un segundo clic mientras el worker corre
+		# duplicaria el registro; se ignora hasta que _check_save termine.
+		if self._saving:
+			return
 		# Validaciones opcionales
 		err = self._validar_curp() or self._validar_telefonos() or self._validar_edad() or self._validar_montos()
 		if err:
 			messagebox.showerror("Validacion", err)
 			return
 
-		primer = self.vars_personal.get("primer_nombre", tk.StringVar()).get().strip()
-		segundo = self.vars_personal.get("segundo_nombre", tk.StringVar()).get().strip()
-		ap_pat = self.vars_personal.get("apellido_paterno", tk.StringVar()).get().strip()
-		ap_mat = self.vars_personal.get("apellido_materno", tk.StringVar()).get().strip()
+		# Un solo round-trip Tcl por campo; los derivados se calculan sobre el
+		# dict ya leido en lugar de volver a consultar las vars.
+		cliente = {k: get() for k, get in self._getters.items()}
+		for k in _STRIP_KEYS:
+			cliente[k] = cliente[k].strip()
+		primer, segundo = cliente["primer_nombre"], cliente["segundo_nombre"]
+		cliente["nombre"] = " ".join([x for x in [primer, segundo] if x]).strip()
+		# _validar_curp acepta minusculas (valida con .upper()); se persiste
+		# ya normalizada para que el patron del esquema no la rechace.
+		curp = cliente["curp"] = cliente["curp"].upper()
+		cliente["fecha_nacimiento"] = self._get_fecha_nacimiento()
 
-		nombre = " ".join([x for x in [primer, segundo] if x]).strip()
-
-		curp = self.vars_personal.get("curp", tk.StringVar()).get().strip()
 		if curp and self._existe_por_curp(curp):
 			if not messagebox.askyesno("Duplicado", "Ya existe un cliente con ese CURP. ¿Desea continuar?"):
 				return
-
-		cliente = {
-			"primer_nombre": primer,
-			"segundo_nombre": segundo,
-			"apellido_paterno": ap_pat,
-			"apellido_materno": ap_mat,
-			"nombre": nombre,
-			"curp": curp,
-			"fecha_nacimiento": self._get_fecha_nacimiento(),
-			"edad": self.vars_personal.get("edad", tk.StringVar()).get(),
-			"genero": self.vars_personal.get("genero", tk.StringVar()).get(),
-			"estado_civil": self.vars_personal.get("estado_civil", tk.StringVar()).get(),
-			"telefono": self.vars_personal.get("telefono", tk.StringVar()).get(),
-			"correo": self.vars_personal.get("correo", tk.StringVar()).get(),
-			"pais": self.vars_personal.get("pais", tk.StringVar()).get(),
-			"estado": self.vars_personal.get("estado", tk.StringVar()).get(),
-			"ciudad": self.vars_personal.get("ciudad", tk.StringVar()).get(),
-			"zona": self.vars_personal.get("zona", tk.StringVar()).get(),
-			"ocupacion": self.vars_laboral.get("ocupacion", tk.StringVar()).get(),
-			"antiguedad_laboral": self.vars_laboral.get("antiguedad_laboral", tk.StringVar()).get(),
-			"ingreso_mensual": self.vars_financiero.get("ingreso_mensual", tk.StringVar()).get(),
-			"tipo_credito": self.vars_financiero.get("tipo_credito", tk.StringVar()).get(),
-			"buro_credito": self.vars_financiero.get("buro_credito", tk.StringVar()).get(),
-			"presupuesto_min": self.vars_financiero.get("presupuesto_min", tk.StringVar()).get(),
-			"presupuesto_max": self.vars_financiero.get("presupuesto_max", tk.StringVar()).get(),
-			"nivel_educativo": self.vars_academico.get("nivel_educativo", tk.StringVar()).get(),
-			"hijos": self.vars_familiar.get("hijos", tk.StringVar()).get(),
-			"origen_captacion": self.vars_captacion.get("origen_captacion", tk.StringVar()).get(),
-			"pi_pais": self.vars_prop_interes.get("pi_pais", tk.StringVar()).get(),
-			"pi_estado": self.vars_prop_interes.get("pi_estado", tk.StringVar()).get(),
-			"pi_ciudad": self.vars_prop_interes.get("pi_ciudad", tk.StringVar()).get(),
-			"pi_zona": self.vars_prop_interes.get("pi_zona", tk.StringVar()).get(),
-			"pi_tipo": self.vars_prop_interes.get("pi_tipo", tk.StringVar()).get(),
-			"zona_interes": self.vars_prop_interes.get("zona_interes", tk.StringVar()).get(),
-			"deudor_alimenticio": self.vars_historial.get("deudor_alimenticio", tk.StringVar()).get(),
-			"propiedades_previas": self.vars_historial.get("propiedades_previas", tk.StringVar()).get(),
-			"num_propiedades_previas": self.vars_historial.get("num_propiedades_previas", tk.StringVar()).get(),
-			"edad_adquisicion": self.vars_historial.get("edad_adquisicion", tk.StringVar()).get(),
-			"estado_cliente": self.vars_stats.get("estado_cliente", tk.StringVar()).get() if hasattr(self, "vars_stats") else "",
-			"tipo_cliente": self.vars_stats.get("tipo_cliente", tk.StringVar()).get() if hasattr(self, "vars_stats") else "",
-			"etapa_embudo": self.vars_stats.get("etapa_embudo", tk.StringVar()).get() if hasattr(self, "vars_stats") else "",
-		}
 		if not cliente.get("metodo_captacion"):
 			cliente["metodo_captacion"] = cliente.get("origen_captacion", "")
 		if self.mode == "editar" and self.cliente.get("id") is not None:
 			cliente["id"] = self.cliente.get("id")
 
+		if _validator is not None:
+			try:
+				_validator(cliente)
+			except fastjsonschema.JsonSchemaException as exc:  # type: ignore[union-attr]
+				messagebox.showerror("Validacion", exc.message)
+				return
+
+		# El dict ya es un snapshot puro de Python: seguro para otro hilo.
+		self._saving = True
+		self.btn_guardar.config(state=tk.DISABLED)
+		persist = _clientes_save if _clientes_save else _guardar_en_store
+		fut = _EXEC.submit(persist, cliente)
+		self.after(50, lambda: self._check_save(fut))
+
+	def _on_cerrar(self) -> None:
+		# Reutilizable: ocultar y avisar al caller; de lo contrario destruir.
+		if self._reusable:
+			self.grab_release()
+			self.withdraw()
+			self._cerrado.set(True)
+		else:
+			self.destroy()
+
+	def destroy(self) -> None:
 		try:
-			if clientes_module and hasattr(clientes_module, "save"):
-				clientes_module.save(cliente)  # type: ignore
-			else:
-				raise RuntimeError("Modulo de clientes no disponible")
+			# Despierta cualquier wait_variable pendiente sobre el dialogo.
+			self._cerrado.set(True)
+		except Exception:
+			pass
+		# Cada StringVar registra una variable (y sus traces, un comando) en el
+		# interprete Tcl que persiste hasta el GC de Python; limpiarlos aqui
+		# acota la memoria del interprete en sesiones con muchos abrir/cerrar.
+		for key, v in self.vars.items():
+			if key.endswith("__widget"):
+				continue
+			try:
+				for modes, cbname in v.trace_info():
+					v.trace_remove(modes[0], cbname)
+			except Exception:
+				pass
+			try:
+				self.tk.globalunsetvar(v._name)
+			except Exception:
+				pass
+		super().destroy()
+
+	def _check_save(self, fut: Any) -> None:
+		if not fut.done():
+			self.after(50, lambda: self._check_save(fut))
+			return
+		self._saving = False
+		self.btn_guardar.config(state=tk.NORMAL)
+		try:
+			fut.result()
 		except Exception:
 			LOG.exception("Error guardando cliente")
 			messagebox.showerror("Error", "No se pudo guardar el cliente.")
 			return
 
+		_find_by_curp_cached.cache_clear()
 		messagebox.showinfo("Exito", "Cliente guardado correctamente.")
-		self.destroy()
+		self._on_cerrar()
 
 
 def main_test() -> None:
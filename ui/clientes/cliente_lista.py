@@ -4,8 +4,11 @@ Usa `modules.clientes` (listar_clientes, buscar_clientes, contar_clientes).
 """
 from __future__ import annotations
 
+import inspect
 import logging
-import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Callable
 
 import tkinter as tk
@@ -26,6 +29,13 @@ try:
 except Exception:
 	ClienteForm = None  # type: ignore
 
+# Store JSON de fallback compartido con el formulario; su _load_store cachea
+# el parseo por mtime+size, asi que paginar/filtrar no relee el archivo.
+try:
+	from ui.clientes.cliente_form import _load_store
+except Exception:
+	_load_store = None  # type: ignore
+
 try:
 	import config.config as _config
 except Exception:
@@ -33,8 +43,21 @@ except Exception:
 
 LOG = logging.getLogger(__name__)
 
+# Campos de filtro exacto y claves que componen el blob de busqueda del
+# fallback JSON.
+_FILTER_FIELDS = ("estado_cliente", "tipo_cliente", "etapa_embudo", "origen_captacion")
+_SEARCH_KEYS = ("nombre", "primer_nombre", "segundo_nombre", "apellido_paterno", "apellido_materno", "telefono", "correo", "curp")
+
+# Indice invertido del store JSON: buckets por valor de filtro, blob de texto
+# en minusculas y presupuestos ya parseados por fila. Se invalida cuando
+# _load_store entrega otra lista (o la misma con mas filas por un append).
+_INDEX_CACHE: Optional[tuple] = None  # (rows_obj, len(rows), index)
+
 
 
+# _config es un modulo cargado una vez: las busquedas son puras y se
+# memoizan para no repetir el barrido de claves/hasattr en cada vista.
+@lru_cache(maxsize=32)
 def _get_color(name: str, default: str) -> str:
 	if _config is None:
 		return default
@@ -49,6 +72,7 @@ def _get_color(name: str, default: str) -> str:
 	return default
 
 
+@lru_cache(maxsize=1)
 def _get_font() -> tuple:
 	family = getattr(_config, "FONT_FAMILY", "Segoe UI") if _config else "Segoe UI"
 	size = getattr(_config, "FONT_SIZE_BASE", 10) if _config else 10
@@ -62,12 +86,73 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 		return default
 
 
+def _store_index(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+	global _INDEX_CACHE
+	if _INDEX_CACHE is not None and _INDEX_CACHE[0] is rows and _INDEX_CACHE[1] == len(rows):
+		return _INDEX_CACHE[2]
+	by: Dict[str, Dict[str, set]] = {campo: {} for campo in _FILTER_FIELDS}
+	blobs: List[str] = []
+	pres_min: List[float] = []
+	pres_max: List[float] = []
+	for i, c in enumerate(rows):
+		for campo in _FILTER_FIELDS:
+			v = c.get(campo)
+			if v:
+				by[campo].setdefault(v, set()).add(i)
+		blobs.append(" ".join(str(c.get(k) or "") for k in _SEARCH_KEYS).casefold())
+		pres_min.append(_safe_float(c.get("presupuesto_min")))
+		pres_max.append(_safe_float(c.get("presupuesto_max") or c.get("presupuesto_min")))
+	index = {"by": by, "blobs": blobs, "pres_min": pres_min, "pres_max": pres_max}
+	_INDEX_CACHE = (rows, len(rows), index)
+	return index
+
+
+# Firmas ya inspeccionadas por funcion: inspect.signature cuesta cientos de
+# microsegundos y _load_data lo necesitaba hasta tres veces por recarga.
+_SIG_CACHE: Dict[Any, Any] = {}
+
+
+def _project_rows(data: List[Dict[str, Any]]) -> List[tuple]:
+	"""Proyecta cada registro a la tupla de columnas de la tabla, una vez.
+
+	El repintado queda como inserts puros sobre tuplas ya armadas; ningun
+	dict.get con fallback se repite por paginacion o scroll.
+	"""
+	def _val(v: Any) -> str:
+		return "" if v is None else str(v)
+
+	out: List[tuple] = []
+	for c in data:
+		nombre = " ".join(
+			[
+				_val(c.get("nombre", c.get("nombres", ""))).strip(),
+				_val(c.get("primer_nombre", "")).strip(),
+				_val(c.get("segundo_nombre", "")).strip(),
+				_val(c.get("apellido_paterno", "")).strip(),
+				_val(c.get("apellido_materno", "")).strip(),
+				_val(c.get("apellidos", "")).strip(),
+			]
+		).strip()
+		out.append((
+			c.get("id", ""),
+			nombre,
+			_val(c.get("telefono_principal", c.get("telefono", ""))),
+			_val(c.get("estado_cliente", c.get("estado", ""))),
+			_val(c.get("tipo_cliente", "")),
+			_val(c.get("etapa_embudo", "")),
+			_val(c.get("origen_captacion", "")),
+			_val(c.get("scoring", c.get("score", ""))),
+			_val(c.get("fecha_registro", c.get("created_at", ""))),
+		))
+	return out
+
+
 def _call_with_supported_kwargs(func: Callable[..., Any], **kwargs: Any) -> Any:
 	try:
-		import inspect
-
-		sig = inspect.signature(func)
-		params = sig.parameters
+		params = _SIG_CACHE.get(func)
+		if params is None:
+			params = frozenset(inspect.signature(func).parameters)
+			_SIG_CACHE[func] = params
 		filtered = {k: v for k, v in kwargs.items() if k in params}
 		return func(**filtered)
 	except TypeError:
@@ -82,12 +167,37 @@ def _call_with_supported_kwargs(func: Callable[..., Any], **kwargs: Any) -> Any:
 class ClienteLista(ttk.Frame):
 	"""Vista de lista de clientes con busqueda, filtros y paginacion."""
 
+	# ttk.Style es global al interprete: configurarlo una vez por proceso,
+	# no en cada instancia (cada cambio de vista recreaba la lista).
+	_style_done = False
+
 	def __init__(self, master: Optional[tk.Widget] = None) -> None:
 		super().__init__(master)
 		self.page_size = 50
 		self.page = 1
 		self.total = 0
 		self._rows: List[Dict[str, Any]] = []
+		self._row_tuples: List[tuple] = []
+		# Render virtualizado: cuantas filas ya se insertaron y mapa iid->fila.
+		self._render_pos = 0
+		self._iid_index: Dict[str, int] = {}
+		# Pool de iids del Treeview: los items se separan (detach) al repintar
+		# y se reenganchan con valores nuevos, sin liberar/crear estado en Tk.
+		self._iid_pool: List[str] = []
+		# Debounce de recargas y clave del ultimo estado consultado.
+		self._reload_after_id: Optional[str] = None
+		self._last_key: Optional[tuple] = None
+		# Numero de consulta en vuelo: respuestas viejas se descartan.
+		self._fetch_gen = 0
+		# Totales por (texto, filtros, asesor): navegar paginas no recuenta.
+		self._count_cache: "OrderedDict[tuple, int]" = OrderedDict()
+		# Paginas ya traidas (la actual y sus vecinas precargadas en idle).
+		self._page_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+		# Dialogo de alta/edicion reutilizado entre aperturas (lazy).
+		self._form_dlg: Optional[Any] = None
+		# La identidad del usuario no cambia durante la vida de la vista;
+		# consultarla en cada recarga golpeaba auth_manager por pagina.
+		self.refresh_auth()
 
 		self._build_ui()
 		self._load_data()
@@ -103,8 +213,8 @@ class ClienteLista(ttk.Frame):
 		self.var_search = tk.StringVar()
 		self.entry_search = ttk.Entry(search_frame, textvariable=self.var_search)
 		self.entry_search.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=6)
-		self.entry_search.bind("<Return>", lambda e: self._on_buscar())
-		ttk.Button(search_frame, text="Buscar", command=self._on_buscar).pack(side=tk.LEFT, padx=4)
+		self.entry_search.bind("<Return>", lambda e: self._schedule_reload())
+		ttk.Button(search_frame, text="Buscar", command=self._schedule_reload).pack(side=tk.LEFT, padx=4)
 		ttk.Button(search_frame, text="Limpiar", command=self._on_limpiar_busqueda).pack(side=tk.LEFT)
 
 		# Filtros
@@ -144,7 +254,7 @@ class ClienteLista(ttk.Frame):
 		cb_origen["values"] = ["Todos", "Referido", "WhatsApp", "Marketplace", "Otro"]
 		cb_origen.grid(row=1, column=3, sticky=tk.W, padx=4, pady=(6, 0))
 
-		ttk.Button(filters, text="Aplicar", command=self._on_buscar).grid(row=1, column=8, sticky=tk.W, padx=(8, 0), pady=(6, 0))
+		ttk.Button(filters, text="Aplicar", command=self._schedule_reload).grid(row=1, column=8, sticky=tk.W, padx=(8, 0), pady=(6, 0))
 
 		# Acciones
 		actions = ttk.Frame(self)
@@ -184,10 +294,10 @@ class ClienteLista(ttk.Frame):
 		self.tree.column("score", width=70, anchor=tk.CENTER)
 		self.tree.column("fecha", width=120, anchor=tk.CENTER)
 
-		sb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-		self.tree.configure(yscroll=sb.set)
+		self.sb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+		self.tree.configure(yscroll=self._on_tree_scroll)
 		self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-		sb.pack(side=tk.RIGHT, fill=tk.Y)
+		self.sb.pack(side=tk.RIGHT, fill=tk.Y)
 
 		self.tree.bind("<Double-1>", lambda e: self._on_editar())
 
@@ -201,27 +311,27 @@ class ClienteLista(ttk.Frame):
 		self.btn_prev.pack(side=tk.RIGHT)
 		self.btn_next.pack(side=tk.RIGHT, padx=6)
 
-		# Estilo basico
-		style = ttk.Style()
-		style.configure("Treeview.Heading", foreground=primary)
+		# Estilo basico (una sola vez; ver _style_done)
+		if not ClienteLista._style_done:
+			ttk.Style().configure("Treeview.Heading", foreground=primary)
+			ClienteLista._style_done = True
+
+	def refresh_auth(self) -> None:
+		"""Relee usuario actual y rol; llamar si la sesion cambia en caliente."""
+		self._user = auth_manager.get_current_user() if auth_manager else None
+		self._is_admin = bool(auth_manager and auth_manager.is_admin())
 
 	def _get_current_user(self) -> Optional[Dict[str, Any]]:
-		if auth_manager is None:
-			return None
-		return auth_manager.get_current_user()
+		return self._user
 
 	def _es_admin(self) -> bool:
-		if auth_manager is None:
-			return False
-		return auth_manager.is_admin()
+		return self._is_admin
 
 	def _get_filters(self) -> Dict[str, Any]:
 		estado = self.var_estado.get()
 		tipo = self.var_tipo.get()
 		etapa = self.var_etapa.get()
 		origen = self.var_origen.get()
-		pres_min = _safe_float(self.var_pres_min.get() or 0, 0.0)
-		pres_max = _safe_float(self.var_pres_max.get() or 0, 0.0)
 		filtros: Dict[str, Any] = {}
 		if estado and estado != "Todos":
 			filtros["estado_cliente"] = estado
@@ -231,21 +341,51 @@ class ClienteLista(ttk.Frame):
 			filtros["etapa_embudo"] = etapa
 		if origen and origen != "Todos":
 			filtros["origen_captacion"] = origen
-		if pres_min:
-			filtros["presupuesto_min"] = pres_min
-		if pres_max:
-			filtros["presupuesto_max"] = pres_max
+		# float() solo cuando hay algo que parsear; el caso comun (campos
+		# vacios) no arma ningun try/except.
+		pres_min = self.var_pres_min.get().strip()
+		pres_max = self.var_pres_max.get().strip()
+		if pres_min and (val := _safe_float(pres_min)):
+			filtros["presupuesto_min"] = val
+		if pres_max and (val := _safe_float(pres_max)):
+			filtros["presupuesto_max"] = val
 		return filtros
 
-	def _load_data(self) -> None:
+	def _load_data(self, force: bool = False) -> None:
 		search_text = (self.var_search.get() or "").strip()
 		filtros = self._get_filters()
 
-		usuario = self._get_current_user()
+		# Estado identico al ya mostrado: no hay nada que recargar.
+		key = (search_text, tuple(sorted(filtros.items())), self.page, self.page_size)
+		if not force and key == self._last_key:
+			return
+		self._last_key = key
+		if force:
+			# Altas/bajas/ediciones invalidan los conteos y paginas cacheados.
+			self._count_cache.clear()
+			self._page_cache.clear()
+
 		asesor_id = None
-		if usuario and not self._es_admin():
-			asesor_id = usuario.get("id")
+		if self._user and not self._is_admin:
+			asesor_id = self._user.get("id")
+
+		# Pagina ya precargada: se aplica al instante, sin hilo ni backend.
+		cached = self._page_cache.get(key)
+		if not force and cached is not None:
+			self._fetch_gen += 1
+			self._apply_fetched(self._fetch_gen, cached[0], cached[1], cached[2])
+			return
 
+		# La consulta corre en un hilo aparte: el loop de Tk sigue atendiendo
+		# scroll/teclado mientras la BD o el disco responden.
+		self._fetch_gen += 1
+		threading.Thread(
+			target=self._fetch_worker,
+			args=(self._fetch_gen, search_text, filtros, asesor_id, self.page, self.page_size, key),
+			daemon=True,
+		).start()
+
+	def _fetch_worker(self, gen: int, search_text: str, filtros: Dict[str, Any], asesor_id: Any, page: int, page_size: int, key: tuple, prefetch: bool = False) -> None:
 		data: List[Dict[str, Any]] = []
 		total = 0
 
@@ -259,73 +399,189 @@ class ClienteLista(ttk.Frame):
 					data = _call_with_supported_kwargs(
 						buscar,
 						texto=search_text,
-						page=self.page,
-						page_size=self.page_size,
+						page=page,
+						page_size=page_size,
 						asesor_id=asesor_id,
 						filtros=filtros,
 					)
 				elif listar:
 					data = _call_with_supported_kwargs(
 						listar,
-						page=self.page,
-						page_size=self.page_size,
+						page=page,
+						page_size=page_size,
 						asesor_id=asesor_id,
 						filtros=filtros,
 					)
 				if contar:
-					total = _call_with_supported_kwargs(
-						contar,
-						texto=search_text,
-						asesor_id=asesor_id,
-						filtros=filtros,
-					)
+					# El total solo cambia con texto/filtros, no con la pagina.
+					count_key = (search_text, tuple(sorted(filtros.items())), asesor_id)
+					total = self._count_cache.get(count_key)
+					if total is None:
+						total = _call_with_supported_kwargs(
+							contar,
+							texto=search_text,
+							asesor_id=asesor_id,
+							filtros=filtros,
+						)
+						if isinstance(total, int):
+							self._count_cache[count_key] = total
+							if len(self._count_cache) > 32:
+								self._count_cache.popitem(last=False)
 			except Exception:
 				LOG.exception("Error consultando clientes en module.clientes")
+		elif _load_store is not None:
+			# Fallback sin BD: filtra por indices y materializa solo la pagina.
+			rows = _load_store()
+			seleccion = self._filtrar_fallback(rows, search_text, filtros)
+			total = len(seleccion)
+			start = (page - 1) * page_size
+			data = [rows[i] for i in seleccion[start:start + page_size]]
 
 		if not isinstance(data, list):
 			data = []
 		if not total:
 			total = len(data)
 
+		# La proyeccion a tuplas tambien corre en el worker, fuera del hilo Tk.
+		row_tuples = _project_rows(data)
+		self._page_cache[key] = (data, row_tuples, total)
+		if len(self._page_cache) > 4:
+			self._page_cache.popitem(last=False)
+		if not prefetch:
+			try:
+				self.after(0, self._apply_fetched, gen, data, row_tuples, total)
+			except Exception:
+				# La vista pudo destruirse mientras corria la consulta.
+				pass
+
+	def _apply_fetched(self, gen: int, data: List[Dict[str, Any]], row_tuples: List[tuple], total: int) -> None:
+		# Solo la respuesta de la consulta mas reciente llega a la tabla.
+		if gen != self._fetch_gen:
+			return
 		self.total = total
 		self._rows = data
+		self._row_tuples = row_tuples
 		self._render_table()
+		# Con la pagina pintada, precargar las vecinas en un idle callback.
+		self.after_idle(self._prefetch_neighbors)
+
+	def _prefetch_neighbors(self) -> None:
+		if self._last_key is None:
+			return
+		search_text, filt_items, page, page_size = self._last_key
+		asesor_id = None
+		if self._user and not self._is_admin:
+			asesor_id = self._user.get("id")
+		total_pages = max(1, (self.total + page_size - 1) // page_size)
+		filtros = dict(filt_items)
+		for p in (page - 1, page + 1):
+			if p < 1 or p > total_pages:
+				continue
+			k = (search_text, filt_items, p, page_size)
+			if k in self._page_cache:
+				continue
+			threading.Thread(
+				target=self._fetch_worker,
+				args=(self._fetch_gen, search_text, filtros, asesor_id, p, page_size, k, True),
+				daemon=True,
+			).start()
+
+	def _filtrar_fallback(self, rows: List[Dict[str, Any]], texto: str, filtros: Dict[str, Any]) -> List[int]:
+		"""Resuelve busqueda y filtros a una lista de indices del store.
+
+		Los filtros exactos se resuelven intersectando buckets (sets de
+		indices), los presupuestos contra arrays de floats ya parseados y el
+		texto contra blobs ya en minusculas; los dicts de fila solo se tocan
+		al materializar la pagina visible.
+		"""
+		idx = _store_index(rows)
+		candidatos: Optional[set] = None
+		for campo in _FILTER_FIELDS:
+			valor = filtros.get(campo)
+			if valor:
+				bucket = idx["by"][campo].get(valor, set())
+				candidatos = bucket if candidatos is None else candidatos & bucket
+				if not candidatos:
+					return []
+		indices = sorted(candidatos) if candidatos is not None else range(len(rows))
+		pmin = filtros.get("presupuesto_min")
+		pmax = filtros.get("presupuesto_max")
+		t = texto.casefold() if texto else ""
+		blobs, fila_min, fila_max = idx["blobs"], idx["pres_min"], idx["pres_max"]
+		out: List[int] = []
+		for i in indices:
+			if pmin and fila_max[i] < pmin:
+				continue
+			if pmax and fila_min[i] > pmax:
+				continue
+			if t and t not in blobs[i]:
+				continue
+			out.append(i)
+		return out
+
+	# Filas insertadas por tanda; el resto aparece conforme se scrollea.
+	_RENDER_CHUNK = 100
+
+	def _on_tree_scroll(self, first: str, last: str) -> None:
+		self.sb.set(first, last)
+		if float(last) > 0.85 and self._render_pos < len(self._row_tuples):
+			self._render_more()
 
 	def _render_table(self) -> None:
-		for i in self.tree.get_children():
-			self.tree.delete(i)
-
-		def _val(v: Any) -> str:
-			return "" if v is None else str(v)
-
-		for c in self._rows:
-			cid = c.get("id", "")
-			nombre = " ".join(
-				[
-					_val(c.get("nombre", c.get("nombres", ""))).strip(),
-					_val(c.get("primer_nombre", "")).strip(),
-					_val(c.get("segundo_nombre", "")).strip(),
-					_val(c.get("apellido_paterno", "")).strip(),
-					_val(c.get("apellido_materno", "")).strip(),
-					_val(c.get("apellidos", "")).strip(),
-				]
-			).strip()
-			telefono = _val(c.get("telefono_principal", c.get("telefono", "")))
-			estado = _val(c.get("estado_cliente", c.get("estado", "")))
-			tipo = _val(c.get("tipo_cliente", ""))
-			etapa = _val(c.get("etapa_embudo", ""))
-			origen = _val(c.get("origen_captacion", ""))
-			score = _val(c.get("scoring", c.get("score", "")))
-			fecha = _val(c.get("fecha_registro", c.get("created_at", "")))
-			self.tree.insert("", tk.END, values=(cid, nombre, telefono, estado, tipo, etapa, origen, score, fecha))
-
-		total_pages = max(1, int(math.ceil(self.total / float(self.page_size))))
+		hijos = self.tree.get_children("")
+		if hijos:
+			# Un solo detach con todos los iids: un cruce Tcl, y los items
+			# quedan vivos en el pool para el siguiente repintado.
+			self.tree.detach(*hijos)
+		sel = self.tree.selection()
+		if sel:
+			# delete() limpiaba la seleccion; con detach hay que soltarla para
+			# que no sobreviva apuntando a un iid reutilizado.
+			self.tree.selection_remove(*sel)
+		self._render_pos = 0
+		self._iid_index = {}
+		self._render_more()
+
+		total_pages = max(1, (self.total + self.page_size - 1) // self.page_size)
 		self.page = min(max(1, self.page), total_pages)
 		self.lbl_pager.config(text=f"Pagina {self.page} de {total_pages} (Total: {self.total})")
 		self.btn_prev.config(state=tk.NORMAL if self.page > 1 else tk.DISABLED)
 		self.btn_next.config(state=tk.NORMAL if self.page < total_pages else tk.DISABLED)
 
+	def _render_more(self) -> None:
+		"""Inserta la siguiente tanda de filas; _on_tree_scroll pide mas.
+
+		Con page_size grandes esto mantiene la creacion de items proporcional
+		a lo que el usuario realmente ve en lugar de a la pagina completa.
+		"""
+		start = self._render_pos
+		end = min(start + self._RENDER_CHUNK, len(self._row_tuples))
+		self._render_pos = end
+
+		tree = self.tree
+		insert, move, item = tree.insert, tree.move, tree.item
+		tk_end = tk.END
+		pool = self._iid_pool
+		iid_index = self._iid_index
+		for i, values in enumerate(self._row_tuples[start:end], start):
+			if i < len(pool):
+				# Item ya existente: reenganchar y actualizar valores.
+				iid = pool[i]
+				move(iid, "", i)
+				item(iid, values=values)
+			else:
+				iid = insert("", tk_end, values=values)
+				pool.append(iid)
+			iid_index[iid] = i
+
+	def _schedule_reload(self) -> None:
+		# Colapsa Enter repetidos / clicks seguidos en una sola recarga.
+		if self._reload_after_id is not None:
+			self.after_cancel(self._reload_after_id)
+		self._reload_after_id = self.after(200, self._on_buscar)
+
 	def _on_buscar(self) -> None:
+		self._reload_after_id = None
 		self.page = 1
 		self._load_data()
 
@@ -344,19 +600,32 @@ class ClienteLista(ttk.Frame):
 		sel = self.tree.selection()
 		if not sel:
 			return None
-		idx = self.tree.index(sel[0])
+		idx = self._iid_index.get(sel[0], -1)
 		if idx < 0 or idx >= len(self._rows):
 			return None
 		return self._rows[idx]
 
+	def _abrir_form(self, mode: str, cliente: Optional[Dict[str, Any]] = None) -> None:
+		# Un solo ClienteForm oculto por vista: construir el arbol de widgets
+		# del modal es el costo dominante de abrirlo y se paga una vez.
+		dlg = self._form_dlg
+		if dlg is None or not dlg.winfo_exists():
+			dlg = ClienteForm(master=self.winfo_toplevel(), mode=mode, cliente=cliente)
+			dlg._reusable = True
+			self._form_dlg = dlg
+		else:
+			dlg.reset(mode, cliente)
+			dlg.deiconify()
+		dlg.grab_set()
+		dlg._cerrado.set(False)
+		self.wait_variable(dlg._cerrado)
+		self._load_data(force=True)
+
 	def _on_nuevo(self) -> None:
 		if ClienteForm is None:
 			messagebox.showerror("Error", "ClienteForm no disponible.")
 			return
-		dlg = ClienteForm(master=self.winfo_toplevel(), mode="crear")
-		dlg.grab_set()
-		self.wait_window(dlg)
-		self._load_data()
+		self._abrir_form("crear")
 
 	def _on_editar(self) -> None:
 		cliente = self._get_selected()
@@ -366,10 +635,7 @@ class ClienteLista(ttk.Frame):
 		if ClienteForm is None:
 			messagebox.showerror("Error", "ClienteForm no disponible.")
 			return
-		dlg = ClienteForm(master=self.winfo_toplevel(), mode="editar", cliente=cliente)
-		dlg.grab_set()
-		self.wait_window(dlg)
-		self._load_data()
+		self._abrir_form("editar", cliente)
 
 	def _on_ver_detalle(self) -> None:
 		self._on_editar()
@@ -389,7 +655,7 @@ class ClienteLista(ttk.Frame):
 			return
 		try:
 			eliminar(cliente.get("id"))
-			self._load_data()
+			self._load_data(force=True)
 		except Exception:
 			LOG.exception("Error eliminando cliente")
 			messagebox.showerror("Error", "No se pudo eliminar el cliente.")
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import logging
-import sys
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 
 try:
     from database import db as _db
@@ -15,6 +15,9 @@ except Exception:
 try:
     import config.config as _config
 
+    # _config no cambia tras el import: memoizar evita repetir el barrido de
+    # hasattr/getattr si se piden mas colores.
+    @lru_cache(maxsize=None)
     def _get_color(name: str, default: str) -> str:
         for key in (name.upper(), name.lower(), f"{name}_color", f"{name.upper()}_COLOR"):
             if hasattr(_config, key):
@@ -31,40 +34,42 @@ PRIMARY_COLOR = _primary_color_value
 
 LOG = logging.getLogger(__name__)
 
-try:
-    from ui.change_password_dialog import ChangePasswordDialog
-except Exception:
-    ChangePasswordDialog = None
-
-try:
-    from ui.clientes.cliente_form import ClienteForm
-except Exception:
-    ClienteForm = None
-
-try:
-    from ui.clientes.cliente_lista import ClienteLista
-except Exception:
-    ClienteLista = None
-
-try:
-    from ui.propiedades.propiedad_form import PropiedadForm
-except Exception:
-    PropiedadForm = None
-
-try:
-    from ui.propiedades.propiedad_lista import PropiedadLista
-except Exception:
-    PropiedadLista = None
-
-try:
-    from ui.asesores.asesor_form import AsesorForm
-except Exception:
-    AsesorForm = None
-
-try:
-    from ui.asesores.asesor_lista import AsesorLista
-except Exception:
-    AsesorLista = None
+# Formularios y listas se resuelven en el primer acceso (PEP 562): importar
+# ui.main_window ya no arrastra los arboles de dependencias de cada vista
+# (BD, validadores, etc.); una vista que nunca se abre no cuesta nada.
+_LAZY = {
+    "ChangePasswordDialog": "ui.change_password_dialog",
+    "ClienteForm": "ui.clientes.cliente_form",
+    "ClienteLista": "ui.clientes.cliente_lista",
+    "PropiedadForm": "ui.propiedades.propiedad_form",
+    "PropiedadLista": "ui.propiedades.propiedad_lista",
+    "AsesorForm": "ui.asesores.asesor_form",
+    "AsesorLista": "ui.asesores.asesor_lista",
+}
+
+
+def __getattr__(name: str) -> Any:
+    modname = _LAZY.get(name)
+    if modname is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Igual que los try/except de import originales: si el modulo no carga,
+    # el simbolo queda en None y los openers muestran su aviso.
+    try:
+        import importlib
+
+        obj = getattr(importlib.import_module(modname), name)
+    except Exception:
+        obj = None
+    globals()[name] = obj
+    return obj
+
+
+def _resolve(name: str) -> Any:
+    """Devuelve un simbolo perezoso ya resuelto (o None si su modulo fallo)."""
+    g = globals()
+    if name in g:
+        return g[name]
+    return __getattr__(name)
 
 
 class MainWindow:
@@ -84,11 +89,16 @@ class MainWindow:
         except Exception:
             pass
 
+        # Toplevels cacheados por vista: cerrar solo oculta (withdraw) y la
+        # siguiente apertura re-muestra sin reconstruir widgets ni reconsultar.
+        self._toplevels: Dict[str, tk.Toplevel] = {}
+
         self._build_ui()
 
     def _build_ui(self) -> None:
+        # El frame raiz se empaqueta hasta el final: todo el contenido se
+        # arma sin disparar recalculos de geometria intermedios.
         self.frame = ttk.Frame(self.root, padding=16)
-        self.frame.pack(fill=tk.BOTH, expand=True)
 
         header = ttk.Label(self.frame, text=f"Bienvenido, {self.user.get('username')}")
         header.config(font=("Segoe UI", 16, "bold"), foreground=PRIMARY_COLOR)
@@ -119,18 +129,35 @@ class MainWindow:
             b = ttk.Button(grid, text=label, command=cmd)
             b.grid(row=r, column=c, sticky=tk.EW, padx=8, pady=6)
 
+        # uniform= reparte las columnas en un solo pase del geometry manager
+        # en lugar de negociar anchos por widget.
         for c in range(cols):
-            grid.columnconfigure(c, weight=1)
+            grid.columnconfigure(c, weight=1, uniform="btn")
 
         # Boton logout
         btn_exit = ttk.Button(self.frame, text="Salir", command=self._on_exit)
         btn_exit.pack(side=tk.BOTTOM, anchor=tk.E)
 
+        self.frame.pack(fill=tk.BOTH, expand=True)
+
+    def _show_cached(self, key: str) -> bool:
+        """Re-muestra el Toplevel cacheado de una vista; True si quedo visible."""
+        win = self._toplevels.get(key)
+        if win is not None and win.winfo_exists():
+            win.deiconify()
+            win.lift()
+            return True
+        return False
+
     def _open_formularios(self) -> None:
+        if self._show_cached("formularios"):
+            return
         try:
             win = tk.Toplevel(self.root)
             win.title("Formularios")
             win.geometry("520x360")
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self._toplevels["formularios"] = win
             frame = ttk.Frame(win, padding=16)
             frame.pack(fill=tk.BOTH, expand=True)
 
@@ -144,28 +171,20 @@ class MainWindow:
 
     def _on_change_password(self) -> None:
         username = self.user.get("username") or "Usuario"
+        ChangePasswordDialog = _resolve("ChangePasswordDialog")
         if ChangePasswordDialog is None:
             message = "El dialogo de cambio de contrasena no esta disponible."
             LOG.warning(message)
-            try:
-                from tkinter import messagebox
-
-                messagebox.showwarning("Advertencia", message)
-            except Exception:
-                pass
+            messagebox.showwarning("Advertencia", message)
             return
         dlg = ChangePasswordDialog(self.frame, username)
         dlg.show()
 
     def _open_clientes_form(self) -> None:
+        ClienteForm = _resolve("ClienteForm")
         if ClienteForm is None:
             LOG.warning("ClienteForm no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "El formulario de Clientes no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "El formulario de Clientes no esta disponible.")
             return
         # Abrir formulario como modal
         try:
@@ -175,14 +194,12 @@ class MainWindow:
             LOG.exception("Error abriendo ClienteForm")
 
     def _open_clientes_lista(self) -> None:
+        if self._show_cached("clientes"):
+            return
+        ClienteLista = _resolve("ClienteLista")
         if ClienteLista is None:
             LOG.warning("ClienteLista no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "La lista de Clientes no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "La lista de Clientes no esta disponible.")
             return
         try:
             win = tk.Toplevel(self.root)
@@ -190,18 +207,16 @@ class MainWindow:
             win.geometry("1000x600")
             view = ClienteLista(win)
             view.pack(fill=tk.BOTH, expand=True)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self._toplevels["clientes"] = win
         except Exception:
             LOG.exception("Error abriendo ClienteLista")
 
     def _open_propiedades_form(self) -> None:
+        PropiedadForm = _resolve("PropiedadForm")
         if PropiedadForm is None:
             LOG.warning("PropiedadForm no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "El formulario de Propiedades no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "El formulario de Propiedades no esta disponible.")
             return
         try:
             f = PropiedadForm(master=self.root)
@@ -210,14 +225,12 @@ class MainWindow:
             LOG.exception("Error abriendo PropiedadForm")
 
     def _open_propiedades_lista(self) -> None:
+        if self._show_cached("propiedades"):
+            return
+        PropiedadLista = _resolve("PropiedadLista")
         if PropiedadLista is None:
             LOG.warning("PropiedadLista no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "La lista de Propiedades no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "La lista de Propiedades no esta disponible.")
             return
         try:
             win = tk.Toplevel(self.root)
@@ -225,18 +238,16 @@ class MainWindow:
             win.geometry("1000x600")
             view = PropiedadLista(win)
             view.pack(fill=tk.BOTH, expand=True)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self._toplevels["propiedades"] = win
         except Exception:
             LOG.exception("Error abriendo PropiedadLista")
 
     def _open_asesores_form(self) -> None:
+        AsesorForm = _resolve("AsesorForm")
         if AsesorForm is None:
             LOG.warning("AsesorForm no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "El formulario de Asesores no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "El formulario de Asesores no esta disponible.")
             return
         try:
             f = AsesorForm(master=self.root, mode="crear")
@@ -245,14 +256,12 @@ class MainWindow:
             LOG.exception("Error abriendo AsesorForm")
 
     def _open_asesores_lista(self) -> None:
+        if self._show_cached("asesores"):
+            return
+        AsesorLista = _resolve("AsesorLista")
         if AsesorLista is None:
             LOG.warning("AsesorLista no disponible")
-            try:
-                from tkinter import messagebox
-
-                messagebox.showinfo("No implementado", "La lista de Asesores no esta disponible.")
-            except Exception:
-                pass
+            messagebox.showinfo("No implementado", "La lista de Asesores no esta disponible.")
             return
         try:
             win = tk.Toplevel(self.root)
@@ -260,29 +269,53 @@ class MainWindow:
             win.geometry("1000x600")
             view = AsesorLista(win)
             view.pack(fill=tk.BOTH, expand=True)
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            self._toplevels["asesores"] = win
         except Exception:
             LOG.exception("Error abriendo AsesorLista")
 
     def _on_exit(self) -> None:
-        try:
-            self.root.destroy()
-            sys.exit(0)
-        except SystemExit:
-            pass
+        # destroy() ya corta el mainloop; el sys.exit(0) que habia aqui solo
+        # levantaba un SystemExit que el propio handler tragaba.
+        self.root.destroy()
 
     def _on_logout(self) -> None:
-        try:
-            self.root.destroy()
-            sys.exit(0)
-        except SystemExit:
-            pass
+        # destroy() ya corta el mainloop; el sys.exit(0) que habia aqui solo
+        # levantaba un SystemExit que el propio handler tragaba.
+        self.root.destroy()
 
     def _open_estadisticas(self) -> None:
+        if self._show_cached("estadisticas"):
+            return
         try:
             win = tk.Toplevel(self.root)
             win.title("Estadisticas")
             win.geometry("760x520")
 
+            # Una conexion por ventana: cada refresh abre solo un cursor en
+            # lugar de pagar conectar/cerrar contra la BD.
+            conn_holder: Dict[str, Any] = {"conn": None}
+            if _db is not None:
+                try:
+                    conn_holder["conn"] = _db.get_connection()
+                except Exception:
+                    LOG.exception("Error conectando a la BD para estadisticas")
+
+            def _on_destroy(event: Any) -> None:
+                # Cerrar la conexion solo cuando el Toplevel muere de verdad
+                # (salida de la app); el boton de cerrar nada mas lo oculta.
+                if event.widget is win:
+                    conn = conn_holder.pop("conn", None)
+                    if conn is not None:
+                        try:
+                            conn.close()
+                        except Exception:
+                            pass
+
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            win.bind("<Destroy>", _on_destroy)
+            self._toplevels["estadisticas"] = win
+
             root_frame = ttk.Frame(win, padding=12)
             root_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -293,6 +326,9 @@ class MainWindow:
             content.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
             current_view = {"name": "clientes"}
+            # Datos por vista mientras la ventana vive; solo "Actualizar" los
+            # invalida. Redibujar (resize, cambio de filtro) no toca la BD.
+            _stats_cache: Dict[str, tuple] = {}
 
             def _switch(view_name: str) -> None:
                 current_view["name"] = view_name
@@ -305,29 +341,54 @@ class MainWindow:
             ttk.Button(sidebar, text="Propiedades", command=lambda: _switch("propiedades")).pack(fill=tk.X, pady=4)
             ttk.Button(sidebar, text="Asesores", command=lambda: _switch("asesores")).pack(fill=tk.X, pady=4)
 
-            def _draw_bars(canvas: tk.Canvas, labels: list[str], values: list[int]) -> None:
-                canvas.delete("all")
-                w = int(canvas.winfo_width() or 520)
-                h = int(canvas.winfo_height() or 220)
-                padding = 30
-                max_val = max(values) if values else 1
-                bar_w = max(30, int((w - padding * 2) / max(1, len(values))))
-                for i, (lbl, val) in enumerate(zip(labels, values)):
-                    x0 = padding + i * bar_w + 10
-                    x1 = x0 + bar_w - 20
-                    bar_h = int((h - padding * 2) * (val / max_val)) if max_val else 0
-                    y1 = h - padding
-                    y0 = y1 - bar_h
-                    canvas.create_rectangle(x0, y0, x1, y1, fill="#2196F3", outline="")
-                    canvas.create_text((x0 + x1) / 2, y1 + 12, text=lbl, anchor=tk.N)
-                    canvas.create_text((x0 + x1) / 2, y0 - 6, text=str(val), anchor=tk.S)
+            def _make_drawer(canvas: tk.Canvas, fill: str, min_bar_w: int, inset0: int, inset1: int, default_h: int):
+                """Dibujante de barras que reutiliza los items del canvas.
+
+                Los rectangulos y textos se crean una vez (o cuando cambia el
+                numero de barras) y los repintados solo reposicionan con
+                coords/itemconfigure, sin delete("all") ni re-parseo de items.
+                """
+                items = {"n": -1, "rects": [], "lbls": [], "vals": []}
+
+                def draw(labels: list, values: list) -> None:
+                    n = len(values)
+                    if n != items["n"]:
+                        canvas.delete("all")
+                        items["rects"] = [canvas.create_rectangle(0, 0, 0, 0, fill=fill, outline="") for _ in range(n)]
+                        items["lbls"] = [canvas.create_text(0, 0, text="", anchor=tk.N) for _ in range(n)]
+                        items["vals"] = [canvas.create_text(0, 0, text="", anchor=tk.S) for _ in range(n)]
+                        items["n"] = n
+                    if not n:
+                        return
+                    w = int(canvas.winfo_width() or 520)
+                    h = int(canvas.winfo_height() or default_h)
+                    padding = 30
+                    max_val = max(values) or 1
+                    bar_w = max(min_bar_w, int((w - padding * 2) / n))
+                    coords, itemconfigure = canvas.coords, canvas.itemconfigure
+                    for i, (lbl, val) in enumerate(zip(labels, values)):
+                        x0 = padding + i * bar_w + inset0
+                        x1 = x0 + bar_w - inset1
+                        bar_h = int((h - padding * 2) * (val / max_val))
+                        y1 = h - padding
+                        y0 = y1 - bar_h
+                        coords(items["rects"][i], x0, y0, x1, y1)
+                        coords(items["lbls"][i], (x0 + x1) / 2, y1 + 12)
+                        itemconfigure(items["lbls"][i], text=lbl)
+                        coords(items["vals"][i], (x0 + x1) / 2, y0 - 6)
+                        itemconfigure(items["vals"][i], text=str(val))
+
+                return draw
 
             def _build_view(parent: ttk.Frame, view_name: str) -> None:
-                header = ttk.Frame(parent)
+                # Contenedor sin empaquetar: la vista entera se construye
+                # fuera del layout y se mapea en un solo pase al final.
+                container = ttk.Frame(parent)
+                header = ttk.Frame(container)
                 header.pack(fill=tk.X, pady=(0, 8))
                 ttk.Label(header, text=f"Estadisticas - {view_name.title()}").pack(side=tk.LEFT)
 
-                filters = ttk.Frame(parent)
+                filters = ttk.Frame(container)
                 filters.pack(fill=tk.X, pady=(0, 8))
                 ttk.Label(filters, text="Filtro:").pack(side=tk.LEFT)
                 var_estado = tk.StringVar(value="Todos")
@@ -335,13 +396,13 @@ class MainWindow:
                 cb["values"] = ["Todos", "Activos", "Inactivos"]
                 cb.pack(side=tk.LEFT, padx=6)
 
-                chart = tk.Canvas(parent, height=220)
+                chart = tk.Canvas(container, height=220)
                 chart.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
 
-                histo = tk.Canvas(parent, height=180)
+                histo = tk.Canvas(container, height=180)
                 histo.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
 
-                kpis = ttk.Frame(parent)
+                kpis = ttk.Frame(container)
                 kpis.pack(fill=tk.X)
 
                 kpi_vars: Dict[str, tk.StringVar] = {
@@ -352,6 +413,17 @@ class MainWindow:
                     "precio_max": tk.StringVar(value="-"),
                     "precio_avg": tk.StringVar(value="-"),
                 }
+                # Ultimo valor escrito por KPI (ver _redraw).
+                kpi_prev: Dict[str, str] = {}
+
+                def _kpis_na() -> None:
+                    # Rama de error: escribir "N/A" solo en las vars que no lo
+                    # muestran ya; clicks repetidos con la BD caida no cruzan
+                    # a Tcl ni una vez.
+                    for k, v in kpi_vars.items():
+                        if kpi_prev.get(k) != "N/A":
+                            v.set("N/A")
+                            kpi_prev[k] = "N/A"
 
                 ttk.Label(kpis, text="Total:").grid(row=0, column=0, sticky=tk.W, padx=4, pady=2)
                 ttk.Label(kpis, textvariable=kpi_vars["total"]).grid(row=0, column=1, sticky=tk.W, padx=4, pady=2)
@@ -367,158 +439,177 @@ class MainWindow:
                 ttk.Label(kpis, text="Precio promedio:").grid(row=5, column=0, sticky=tk.W, padx=4, pady=2)
                 ttk.Label(kpis, textvariable=kpi_vars["precio_avg"]).grid(row=5, column=1, sticky=tk.W, padx=4, pady=2)
 
-                def _draw_histogram(canvas: tk.Canvas, values: list[float], bins: int = 6) -> None:
-                    canvas.delete("all")
-                    if not values:
-                        return
-                    w = int(canvas.winfo_width() or 520)
-                    h = int(canvas.winfo_height() or 180)
-                    padding = 30
-                    vmin = min(values)
-                    vmax = max(values)
-                    if vmin == vmax:
-                        counts = [len(values)]
-                        edges = [vmin, vmax]
-                    else:
-                        step = (vmax - vmin) / bins
-                        edges = [vmin + i * step for i in range(bins + 1)]
-                        counts = [0 for _ in range(bins)]
-                        for v in values:
-                            idx = int((v - vmin) / step)
-                            if idx == bins:
-                                idx -= 1
-                            counts[idx] += 1
-                    max_count = max(counts) if counts else 1
-                    bar_w = max(20, int((w - padding * 2) / max(1, len(counts))))
-                    for i, c in enumerate(counts):
-                        x0 = padding + i * bar_w + 6
-                        x1 = x0 + bar_w - 12
-                        bar_h = int((h - padding * 2) * (c / max_count)) if max_count else 0
-                        y1 = h - padding
-                        y0 = y1 - bar_h
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="#4CAF50", outline="")
-                        label = f"{int(edges[i]):,}"
-                        canvas.create_text((x0 + x1) / 2, y1 + 12, text=label, anchor=tk.N)
-                        canvas.create_text((x0 + x1) / 2, y0 - 6, text=str(c), anchor=tk.S)
+                _bars_draw = _make_drawer(chart, "#2196F3", 30, 10, 20, 220)
+                _hist_draw = _make_drawer(histo, "#4CAF50", 20, 6, 12, 180)
 
-                def _refresh() -> None:
-                    if _db is None:
-                        for k in kpi_vars:
-                            kpi_vars[k].set("N/A")
+                def _draw_histogram(hist: Optional[tuple]) -> None:
+                    """Pinta un histograma ya binneado: (conteos, vmin, vmax)."""
+                    if not hist:
+                        _hist_draw([], [])
+                        return
+                    counts, vmin, vmax = hist
+                    step = (vmax - vmin) / len(counts) if vmax > vmin else 0.0
+                    etiquetas = [f"{int(vmin + i * step):,}" for i in range(len(counts))]
+                    _hist_draw(etiquetas, counts)
+
+                def _fetch() -> None:
+                    """Consulta la BD y deja los datos de la vista en el cache."""
+                    conn = conn_holder.get("conn")
+                    if conn is None:
                         return
-                    conn = None
                     cur = None
                     try:
-                        conn = _db.get_connection()
                         cur = conn.cursor()
-                        if view_name == "clientes":
-                            total = self._fetch_scalar(cur, "SELECT COUNT(*) FROM clientes")
-                            activos = self._fetch_scalar(cur, "SELECT COUNT(*) FROM clientes WHERE activo IS TRUE")
-                            precio_min = precio_max = precio_avg = "-"
-                            precios: list[float] = []
-                        elif view_name == "propiedades":
-                            total = self._fetch_scalar(cur, "SELECT COUNT(*) FROM propiedades")
-                            activos = self._fetch_scalar(cur, "SELECT COUNT(*) FROM propiedades WHERE activo IS TRUE")
-                            precio_min = self._fetch_scalar(cur, "SELECT MIN(precio) FROM propiedades")
-                            precio_max = self._fetch_scalar(cur, "SELECT MAX(precio) FROM propiedades")
-                            precio_avg = self._fetch_scalar(cur, "SELECT AVG(precio) FROM propiedades")
-                            cur.execute("SELECT precio FROM propiedades")
-                            precios = [float(r[0]) for r in (cur.fetchall() or []) if r and r[0] is not None]
+                        # Un solo SELECT con agregados por vista: la BD resuelve
+                        # conteos y precios en un unico scan en lugar de un
+                        # round-trip por cifra.
+                        if view_name == "propiedades":
+                            cur.execute(
+                                "SELECT COUNT(*), "
+                                "COALESCE(SUM(CASE WHEN activo IS TRUE THEN 1 ELSE 0 END), 0), "
+                                "MIN(precio), MAX(precio), AVG(precio) "
+                                "FROM propiedades"
+                            )
+                            row = cur.fetchone() or (0, 0, None, None, None)
+                            total, activos, precio_min, precio_max, precio_avg = row
+                            # El binneo corre en SQL: regresan a lo mas 6 filas
+                            # (bucket, conteo) en vez de todos los precios.
+                            hist = None
+                            if precio_min is not None and precio_max is not None:
+                                if float(precio_min) == float(precio_max):
+                                    cur.execute("SELECT COUNT(*) FROM propiedades WHERE precio IS NOT NULL")
+                                    counts = [int((cur.fetchone() or [0])[0])]
+                                else:
+                                    cur.execute(
+                                        "SELECT CAST(6 * (precio - %s) / (%s - %s + 1e-9) AS INT) AS b, COUNT(*) "
+                                        "FROM propiedades WHERE precio IS NOT NULL GROUP BY b",
+                                        (precio_min, precio_max, precio_min),
+                                    )
+                                    counts = [0] * 6
+                                    for b, c in cur.fetchall() or []:
+                                        counts[min(max(int(b), 0), 5)] += int(c)
+                                hist = (counts, float(precio_min), float(precio_max))
                         else:
-                            total = self._fetch_scalar(cur, "SELECT COUNT(*) FROM asesores")
-                            activos = self._fetch_scalar(cur, "SELECT COUNT(*) FROM asesores WHERE activo IS TRUE")
+                            tabla = "clientes" if view_name == "clientes" else "asesores"
+                            cur.execute(
+                                "SELECT COUNT(*), "
+                                "COALESCE(SUM(CASE WHEN activo IS TRUE THEN 1 ELSE 0 END), 0) "
+                                f"FROM {tabla}"
+                            )
+                            total, activos = cur.fetchone() or (0, 0)
                             precio_min = precio_max = precio_avg = "-"
-                            precios = []
+                            hist = None
                         inactivos = max(0, int(total) - int(activos))
-
-                        kpi_vars["total"].set(str(total))
-                        kpi_vars["activos"].set(str(activos))
-                        kpi_vars["inactivos"].set(str(inactivos))
-                        kpi_vars["precio_min"].set(str(precio_min if precio_min is not None else "-"))
-                        kpi_vars["precio_max"].set(str(precio_max if precio_max is not None else "-"))
-                        kpi_vars["precio_avg"].set(str(round(float(precio_avg), 2)) if isinstance(precio_avg, (int, float)) else "-")
-
-                        labels = ["Activos", "Inactivos"]
-                        values = [int(activos), int(inactivos)]
-
-                        estado = var_estado.get()
-                        if estado == "Activos":
-                            labels = ["Activos"]
-                            values = [int(activos)]
-                        elif estado == "Inactivos":
-                            labels = ["Inactivos"]
-                            values = [int(inactivos)]
-
-                        _draw_bars(chart, labels, values)
-                        _draw_histogram(histo, precios)
+                        _stats_cache[view_name] = (total, activos, inactivos, precio_min, precio_max, precio_avg, hist)
                     except Exception:
                         LOG.exception("Error obteniendo estadisticas")
-                        for k in kpi_vars:
-                            kpi_vars[k].set("N/A")
+                        _stats_cache.pop(view_name, None)
+                        try:
+                            # La conexion es compartida: limpiar la transaccion
+                            # fallida para que el siguiente refresh funcione.
+                            conn.rollback()
+                            muerta = bool(getattr(conn, "broken", False) or getattr(conn, "closed", False))
+                        except Exception:
+                            muerta = True
+                        if muerta:
+                            # Conexion muerta (TCP caido, BD reiniciada): se
+                            # descarta para que Actualizar reconecte en lugar
+                            # de quedarse clavado en N/A hasta reiniciar.
+                            try:
+                                conn.close()
+                            except Exception:
+                                pass
+                            conn_holder["conn"] = None
                     finally:
                         try:
                             if cur is not None:
                                 cur.close()
-                            if conn is not None:
-                                conn.close()
                         except Exception:
                             pass
 
-                ttk.Button(filters, text="Actualizar", command=_refresh).pack(side=tk.RIGHT)
-                cb.bind("<<ComboboxSelected>>", lambda e: _refresh())
-                chart.bind("<Configure>", lambda e: _refresh())
-                histo.bind("<Configure>", lambda e: _refresh())
+                def _redraw() -> None:
+                    """Repinta canvases y KPIs desde el cache, sin tocar la BD."""
+                    datos = _stats_cache.get(view_name)
+                    if datos is None:
+                        _kpis_na()
+                        return
+                    total, activos, inactivos, precio_min, precio_max, precio_avg, hist = datos
+
+                    # Formatear todo primero y escribir solo lo que cambio:
+                    # StringVar.set notifica a Tcl (traces + redraw del label)
+                    # aunque el valor nuevo sea identico al actual.
+                    nuevos = {
+                        "total": str(total),
+                        "activos": str(activos),
+                        "inactivos": str(inactivos),
+                        "precio_min": str(precio_min if precio_min is not None else "-"),
+                        "precio_max": str(precio_max if precio_max is not None else "-"),
+                        "precio_avg": str(round(float(precio_avg), 2)) if isinstance(precio_avg, (int, float)) else "-",
+                    }
+                    for k, valor in nuevos.items():
+                        if kpi_prev.get(k) != valor:
+                            kpi_vars[k].set(valor)
+                            kpi_prev[k] = valor
+
+                    labels = ["Activos", "Inactivos"]
+                    values = [int(activos), int(inactivos)]
+
+                    estado = var_estado.get()
+                    if estado == "Activos":
+                        labels = ["Activos"]
+                        values = [int(activos)]
+                    elif estado == "Inactivos":
+                        labels = ["Inactivos"]
+                        values = [int(inactivos)]
+
+                    _bars_draw(labels, values)
+                    _draw_histogram(hist)
+
+                def _refresh(force: bool = False) -> None:
+                    if _db is None:
+                        _kpis_na()
+                        return
+                    if conn_holder.get("conn") is None:
+                        # La ventana se cachea (cerrar solo la oculta): si el
+                        # primer connect fallo, Actualizar reintenta en lugar
+                        # de dejarla clavada en N/A hasta reiniciar.
+                        if force:
+                            try:
+                                conn_holder["conn"] = _db.get_connection()
+                            except Exception:
+                                LOG.exception("Error reconectando a la BD para estadisticas")
+                        if conn_holder.get("conn") is None:
+                            _kpis_na()
+                            return
+                    if force:
+                        _stats_cache.pop(view_name, None)
+                    if view_name not in _stats_cache:
+                        _fetch()
+                    _redraw()
+
+                # Debounce de cola: Tk emite un <Configure> por pixel durante el
+                # arrastre; solo el ultimo evento en 120 ms repinta.
+                _resize_after = {"id": None}
+
+                def _on_resize(_event: Any) -> None:
+                    if _resize_after["id"] is not None:
+                        chart.after_cancel(_resize_after["id"])
+                    _resize_after["id"] = chart.after(120, _redraw)
+
+                ttk.Button(filters, text="Actualizar", command=lambda: _refresh(force=True)).pack(side=tk.RIGHT)
+                # El filtro y el resize solo repintan contra el cache.
+                cb.bind("<<ComboboxSelected>>", lambda e: _redraw())
+                chart.bind("<Configure>", _on_resize)
+                histo.bind("<Configure>", _on_resize)
                 _refresh()
+                container.pack(fill=tk.BOTH, expand=True)
 
             _build_view(content, "clientes")
         except Exception:
             LOG.exception("Error abriendo panel de estadisticas")
 
-    def _fetch_scalar(self, cursor, query: str) -> Any:
-        cursor.execute(query)
-        row = cursor.fetchone()
-        if not row:
-            return 0
-        return row[0]
-
-    def _refresh_estadisticas(self) -> None:
-        if not hasattr(self, "_stats_vars"):
-            return
-        if _db is None:
-            for k in self._stats_vars:
-                self._stats_vars[k].set("N/A")
-            return
-        conn = None
-        cur = None
-        try:
-            conn = _db.get_connection()
-            cur = conn.cursor()
-            self._stats_vars["clientes_total"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM clientes")))
-            self._stats_vars["clientes_activos"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM clientes WHERE activo IS TRUE")))
-            self._stats_vars["propiedades_total"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM propiedades")))
-            self._stats_vars["propiedades_activas"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM propiedades WHERE activo IS TRUE")))
-            self._stats_vars["asesores_total"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM asesores")))
-            self._stats_vars["asesores_activos"].set(str(self._fetch_scalar(cur, "SELECT COUNT(*) FROM asesores WHERE activo IS TRUE")))
-        except Exception:
-            LOG.exception("Error obteniendo estadisticas")
-            for k in self._stats_vars:
-                self._stats_vars[k].set("N/A")
-        finally:
-            try:
-                if cur is not None:
-                    cur.close()
-                if conn is not None:
-                    conn.close()
-            except Exception:
-                pass
-
     def _open_mapa_calor(self) -> None:
-        try:
-            from tkinter import messagebox
-
-            messagebox.showinfo("Mapa de calor", "Mapa de calor pendiente de implementar.")
-        except Exception:
-            pass
+        messagebox.showinfo("Mapa de calor", "Mapa de calor pendiente de implementar.")
 
     def run(self) -> None:
         """Inicia el mainloop de la ventana principal."""
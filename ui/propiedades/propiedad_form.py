@@ -7,7 +7,11 @@ características. El guardado persiste en un store JSON de pruebas si no existe
 """
 from __future__ import annotations
 
+import io
+import json
 import logging
+import os
+import tempfile
 from typing import Any, Dict, List, Optional
 
 import tkinter as tk
@@ -20,6 +24,65 @@ except Exception:
 
 LOG = logging.getLogger(__name__)
 
+# Store JSON de pruebas (fallback cuando `modules.propiedades.save` no existe).
+# La ruta se resuelve una sola vez al importar.
+STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "database", "seeds", "propiedades_store.json")
+_STORE_PATH_ABS = os.path.abspath(STORE_PATH)
+_STORE_DIR = os.path.dirname(_STORE_PATH_ABS)
+# I/O en bloques de 64 KB: un archivo tipico entra en una sola pasada.
+_BUFFER_SIZE = 65536
+
+try:
+	os.makedirs(_STORE_DIR, exist_ok=True)
+except Exception:
+	pass
+
+
+def _load_store() -> List[Dict[str, Any]]:
+	try:
+		with open(_STORE_PATH_ABS, "rb", buffering=_BUFFER_SIZE) as f:
+			data = json.loads(f.read())
+		return data if isinstance(data, list) else []
+	except FileNotFoundError:
+		return []
+	except Exception:
+		LOG.exception("Error leyendo store JSON de propiedades")
+		return []
+
+
+def _save_store(data: List[Dict[str, Any]]) -> None:
+	# Escritura atomica (tempfile + os.replace) para no dejar JSON truncado.
+	# Serializar compacto a bytes primero deja un unico write() grande a
+	# traves del buffer de 64 KB, en vez de un write por token de json.dump.
+	payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+	fd, tmp = tempfile.mkstemp(dir=_STORE_DIR, prefix=".propiedades_", suffix=".json")
+	try:
+		with io.BufferedWriter(io.FileIO(fd, "wb"), buffer_size=_BUFFER_SIZE) as f:
+			f.write(payload)
+		os.replace(tmp, _STORE_PATH_ABS)
+	except Exception:
+		try:
+			os.unlink(tmp)
+		except OSError:
+			pass
+		raise
+
+
+def _guardar_en_store(prop: Dict[str, Any]) -> Dict[str, Any]:
+	data = _load_store()
+	pid = prop.get("id")
+	if pid is not None:
+		for i, registro in enumerate(data):
+			if registro.get("id") == pid:
+				data[i] = {**registro, **prop}
+				break
+		else:
+			data.append(prop)
+	else:
+		prop["id"] = max((int(registro.get("id") or 0) for registro in data), default=0) + 1
+		data.append(prop)
+	_save_store(data)
+	return prop
 
 
 class PropiedadForm(tk.Toplevel):
@@ -27,13 +90,72 @@ class PropiedadForm(tk.Toplevel):
 
 	def __init__(self, master: Any = None, mode: str = "crear", propiedad: Optional[Dict] = None) -> None:
 		super().__init__(master)
-		self.title("Propiedad - " + ("Crear" if mode == "crear" else "Editar"))
-		self.mode = mode
-		self.propiedad = propiedad or {}
 		self.resizable(False, False)
 
+		# Marcada como reutilizable por la lista: cerrar solo oculta la
+		# ventana y _cerrado despierta al wait_variable del llamador.
+		self._reusable = False
+		self._cerrado = tk.BooleanVar(master=self, value=False)
+		self.protocol("WM_DELETE_WINDOW", self._on_cerrar)
+
 		self._fotos: List[str] = []
 		self._build_ui()
+		self.reset(mode, propiedad)
+
+	def reset(self, mode: str = "crear", propiedad: Optional[Dict] = None) -> None:
+		"""Reconfigura la ventana para un nuevo alta/edicion sin reconstruirla."""
+		self.mode = mode
+		self.propiedad = propiedad or {}
+		self.title("Propiedad - " + ("Crear" if mode == "crear" else "Editar"))
+		self._limpiar()
+		if mode == "editar":
+			self._populate()
+
+	def _limpiar(self) -> None:
+		for var in self.vars_basico.values():
+			if isinstance(var, tk.Text):
+				var.delete("1.0", tk.END)
+			else:
+				var.set("")
+		for var in self.vars_ubic.values():
+			var.set("")
+		for var in self.vars_carac.values():
+			var.set(False)
+		self._fotos = []
+		self.lbl_fotos.config(text="0 fotos")
+
+	def _populate(self) -> None:
+		p = self.propiedad
+		self.vars_basico["Título"].set(p.get("titulo", ""))
+		desc = self.vars_basico["Descripción"]
+		if isinstance(desc, tk.Text):
+			desc.insert("1.0", p.get("descripcion", "") or "")
+		self.vars_basico["Precio"].set(p.get("precio", ""))
+		self.vars_basico["Metros Cuadrados"].set(p.get("metros", ""))
+		self.vars_basico["Estado"].set(p.get("estado", ""))
+		ubic = p.get("ubicacion") or {}
+		for key, var in self.vars_ubic.items():
+			var.set(ubic.get(key, ""))
+		carac = p.get("caracteristicas") or {}
+		for key, var in self.vars_carac.items():
+			var.set(bool(carac.get(key)))
+		self._fotos = list(p.get("fotos") or [])
+		self.lbl_fotos.config(text=f"{len(self._fotos)} fotos")
+
+	def _on_cerrar(self) -> None:
+		if self._reusable:
+			self.grab_release()
+			self.withdraw()
+			self._cerrado.set(True)
+		else:
+			self.destroy()
+
+	def destroy(self) -> None:
+		try:
+			self._cerrado.set(True)
+		except Exception:
+			pass
+		super().destroy()
 
 	def _build_ui(self) -> None:
 		frm = ttk.Frame(self, padding=12)
@@ -57,25 +179,41 @@ class PropiedadForm(tk.Toplevel):
 		btn_frame = ttk.Frame(frm)
 		btn_frame.pack(fill=tk.X, pady=(8, 0))
 		ttk.Button(btn_frame, text="Guardar", command=self._on_guardar).pack(side=tk.RIGHT, padx=6)
-		ttk.Button(btn_frame, text="Cancelar", command=self.destroy).pack(side=tk.RIGHT)
+		ttk.Button(btn_frame, text="Cancelar", command=self._on_cerrar).pack(side=tk.RIGHT)
 
 	def _build_basico(self, parent: ttk.Frame) -> None:
-		labels = ["Título", "Descripción", "Precio", "Metros Cuadrados", "Estado"]
-		self.vars_basico = {k: tk.StringVar() for k in labels}
-		for i, label in enumerate(labels):
+		# (etiqueta, clave del dict de guardado, strip al leer)
+		campos = [
+			("Título", "titulo", True),
+			("Descripción", "descripcion", False),
+			("Precio", "precio", True),
+			("Metros Cuadrados", "metros", False),
+			("Estado", "estado", False),
+		]
+		self.vars_basico = {label: tk.StringVar() for label, _clave, _strip in campos}
+		# Getters precalculados por campo: _on_guardar itera esta lista sin
+		# volver a ramificar por isinstance en cada guardado.
+		self._basico_getters: List[tuple] = []
+		for i, (label, clave, strip) in enumerate(campos):
 			ttk.Label(parent, text=label).grid(row=i, column=0, sticky=tk.W, padx=6, pady=4)
 			if label == "Descripción":
 				tx = tk.Text(parent, height=4, width=40)
 				tx.grid(row=i, column=1, sticky=tk.EW, padx=6)
 				self.vars_basico[label] = tx
+				self._basico_getters.append((clave, lambda tx=tx: tx.get("1.0", "end-1c")))
 			else:
-				ttk.Entry(parent, textvariable=self.vars_basico[label]).grid(row=i, column=1, sticky=tk.EW, padx=6)
+				var = self.vars_basico[label]
+				ttk.Entry(parent, textvariable=var).grid(row=i, column=1, sticky=tk.EW, padx=6)
+				if strip:
+					self._basico_getters.append((clave, lambda var=var: var.get().strip()))
+				else:
+					self._basico_getters.append((clave, var.get))
 
 		# Fotos
-		ttk.Label(parent, text="Fotos (máx 20)").grid(row=len(labels), column=0, sticky=tk.W, padx=6, pady=6)
+		ttk.Label(parent, text="Fotos (máx 20)").grid(row=len(campos), column=0, sticky=tk.W, padx=6, pady=6)
 		self.lbl_fotos = ttk.Label(parent, text="0 fotos")
-		self.lbl_fotos.grid(row=len(labels), column=1, sticky=tk.W)
-		ttk.Button(parent, text="Añadir foto (demo)", command=self._agregar_foto_demo).grid(row=len(labels)+1, column=1, sticky=tk.W, padx=6)
+		self.lbl_fotos.grid(row=len(campos), column=1, sticky=tk.W)
+		ttk.Button(parent, text="Añadir foto (demo)", command=self._agregar_foto_demo).grid(row=len(campos)+1, column=1, sticky=tk.W, padx=6)
 
 	def _build_ubicacion(self, parent: ttk.Frame) -> None:
 		labels = ["Calle", "Número", "Colonia", "Ciudad", "Estado", "CP"]
@@ -99,20 +237,14 @@ class PropiedadForm(tk.Toplevel):
 		self.lbl_fotos.config(text=f"{len(self._fotos)} fotos")
 
 	def _on_guardar(self) -> None:
-		# Campos opcionales: no autogenerar
-		titulo = self.vars_basico["Título"].get().strip() if isinstance(self.vars_basico.get("Título"), tk.StringVar) else ""
-		precio = self.vars_basico["Precio"].get().strip() if isinstance(self.vars_basico.get("Precio"), tk.StringVar) else ""
-
-		prop = {
-			"titulo": titulo,
-			"descripcion": (self.vars_basico["Descripción"].get("1.0", tk.END).strip() if isinstance(self.vars_basico.get("Descripción"), tk.Text) else ""),
-			"precio": precio,
-			"metros": self.vars_basico["Metros Cuadrados"].get(),
-			"estado": self.vars_basico["Estado"].get(),
-			"ubicacion": {k: v.get() for k, v in self.vars_ubic.items()},
-			"caracteristicas": {k: v.get() for k, v in self.vars_carac.items()},
-			"fotos": self._fotos,
-		}
+		# Campos opcionales: no autogenerar. Los getters ya saben si leen un
+		# StringVar o el Text de descripcion.
+		prop = {clave: fn() for clave, fn in self._basico_getters}
+		prop.update(
+			ubicacion={k: v.get() for k, v in self.vars_ubic.items()},
+			caracteristicas={k: v.get() for k, v in self.vars_carac.items()},
+			fotos=self._fotos,
+		)
 		if self.mode == "editar" and self.propiedad.get("id") is not None:
 			prop["id"] = self.propiedad.get("id")
 
@@ -120,14 +252,14 @@ class PropiedadForm(tk.Toplevel):
 			if propiedades_module and hasattr(propiedades_module, "save"):
 				propiedades_module.save(prop)
 			else:
-				raise RuntimeError("Modulo de propiedades no disponible")
+				_guardar_en_store(prop)
 		except Exception:
 			LOG.exception("Error guardando propiedad")
 			messagebox.showerror("Error", "No se pudo guardar la propiedad.")
 			return
 
 		messagebox.showinfo("Éxito", "Propiedad guardada correctamente.")
-		self.destroy()
+		self._on_cerrar()
 
 
 def main_test() -> None:
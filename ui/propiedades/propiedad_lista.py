@@ -4,8 +4,13 @@ Usa `modules.propiedades` (listar_propiedades, buscar_propiedades, contar_propie
 """
 from __future__ import annotations
 
+import inspect
 import logging
 import math
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Callable
 
 import tkinter as tk
@@ -30,6 +35,9 @@ LOG = logging.getLogger(__name__)
 
 
 
+# La configuracion no cambia en runtime; memoizar evita recorrer dict y
+# atributos en cada fila/estilo pintado.
+@lru_cache(maxsize=32)
 def _get_color(name: str, default: str) -> str:
 	if _config is None:
 		return default
@@ -44,12 +52,26 @@ def _get_color(name: str, default: str) -> str:
 	return default
 
 
+@lru_cache(maxsize=1)
 def _get_font() -> tuple:
 	family = getattr(_config, "FONT_FAMILY", "Segoe UI") if _config else "Segoe UI"
 	size = getattr(_config, "FONT_SIZE_BASE", 10) if _config else 10
 	return (family, size)
 
 
+# Caracteres con significado en Tcl (sustitucion de comandos/variables,
+# separadores de palabra) que deben escaparse al armar scripts a mano.
+_TCL_SPECIALS = re.compile(r'([\\{}\[\]$" \t;])')
+
+
+def _tcl_quote(value: Any) -> str:
+	"""Devuelve `value` como palabra Tcl segura para interpolar en un eval."""
+	texto = str(value)
+	if not texto:
+		return "{}"
+	return _TCL_SPECIALS.sub(r"\\\1", texto).replace("\n", "\\n")
+
+
 def _safe_float(value: Any, default: float = 0.0) -> float:
 	try:
 		return float(value)
@@ -57,12 +79,52 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
 		return default
 
 
+@lru_cache(maxsize=16)
+def _make_filter(filt_items: tuple) -> Callable[[Dict[str, Any]], bool]:
+	"""Compila un predicado especializado para `filt_items` (filtros ordenados).
+
+	Genera el cuerpo exacto de los filtros activos y lo compila una sola vez;
+	aplicar el predicado fila a fila queda en bytecode recto, sin volver a
+	recorrer el dict de filtros por llamada. Es el hook para cualquier
+	refinado local sobre la pagina ya cargada: el filtrado primario sigue
+	siendo responsabilidad del backend.
+	"""
+	filtros = dict(filt_items)
+	conds = []
+	if "estado" in filtros:
+		conds.append("p.get('estado') == _estado")
+	if "precio_min" in filtros:
+		conds.append("_safe_float(p.get('precio'), 0.0) >= _pmin")
+	if "precio_max" in filtros:
+		conds.append("_safe_float(p.get('precio'), 0.0) <= _pmax")
+	if not conds:
+		return lambda p: True
+	# Los valores entran por el namespace, no interpolados en el fuente.
+	src = "def f(p):\n\treturn " + " and ".join(conds)
+	ns = {
+		"_estado": filtros.get("estado"),
+		"_pmin": filtros.get("precio_min"),
+		"_pmax": filtros.get("precio_max"),
+		"_safe_float": _safe_float,
+	}
+	exec(compile(src, "<filter>", "exec"), ns)
+	return ns["f"]
+
+
+# inspect.signature reconstruye la firma en cada llamada y _load_data la
+# necesitaba hasta tres veces (listar/buscar/contar) por paginacion.
+@lru_cache(maxsize=None)
+def _supported_params(func: Callable[..., Any]) -> frozenset:
+	return frozenset(inspect.signature(func).parameters)
+
+
 def _call_with_supported_kwargs(func: Callable[..., Any], **kwargs: Any) -> Any:
 	try:
-		import inspect
-
-		sig = inspect.signature(func)
-		params = sig.parameters
+		# Las funciones decoradas con @accepts declaran sus kwargs en
+		# __accepts__ y evitan la reflexion por completo.
+		params = getattr(func, "__accepts__", None)
+		if params is None:
+			params = _supported_params(func)
 		filtered = {k: v for k, v in kwargs.items() if k in params}
 		return func(**filtered)
 	except TypeError:
@@ -77,12 +139,56 @@ def _call_with_supported_kwargs(func: Callable[..., Any], **kwargs: Any) -> Any:
 class PropiedadLista(ttk.Frame):
 	"""Vista de lista de propiedades con busqueda, filtros y paginacion."""
 
+	# Filas insertadas por tanda: el viewport muestra ~20, el resto se
+	# materializa recien cuando el scroll se acerca al final.
+	_VISIBLE_CHUNK = 25
+
+	# El estilo de encabezados es global al interprete de Tk; configurarlo
+	# una vez por proceso y no por cada instancia de la vista.
+	_style_done = False
+
 	def __init__(self, master: Optional[tk.Widget] = None) -> None:
 		super().__init__(master)
-		self.page_size = 50
+		# 25 por defecto: el viewport no muestra mas y cada fila extra es
+		# transferencia y render desperdiciados; el usuario puede subirlo.
+		self.page_size = 25
 		self.page = 1
 		self.total = 0
 		self._rows: List[Dict[str, Any]] = []
+		# Paginas ya consultadas por (texto, filtros, pagina, tamano); volver
+		# a una pagina visitada no repite la consulta al backend.
+		self._page_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+		# Precarga de paginas vecinas fuera del hilo de Tk; el contador de
+		# generacion descarta precargas lanzadas con filtros ya viejos.
+		self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+		self._prefetch_gen = 0
+		# Id monotono de consulta: un resultado que llega tarde (el usuario
+		# ya navego a otra pagina) se descarta en _apply_fetch.
+		self._load_req = 0
+		self._filter_sig: "Optional[tuple]" = None
+		# Ultima clave pintada: repetir la misma consulta (Buscar dos veces,
+		# Limpiar ya limpio) no toca el backend ni repinta.
+		self._last_key: "Optional[tuple]" = None
+		# Orden delegado al backend cuando lo soporte; nunca se ordena ni
+		# filtra client-side sobre la pagina recibida.
+		self._sort: Optional[str] = None
+		self._order: Optional[str] = None
+		# Debounce de busqueda: un solo query al dejar de teclear.
+		self._search_after_id: Optional[str] = None
+		# Instancia unica y oculta de PropiedadForm, reutilizada entre altas
+		# y ediciones para no reconstruir el notebook del modal cada vez.
+		self._form_dlg: Optional[Any] = None
+		# Mapa id de propiedad -> iid del Treeview para actualizar en sitio.
+		self._tree_iids: Dict[str, str] = {}
+		# Tuplas de valores por fila, materializadas una vez por fetch para no
+		# repetir los seis p.get() por fila en cada repintado.
+		self._row_values: Dict[str, tuple] = {}
+		# Render virtualizado: items pendientes y cuantos ya estan en el arbol.
+		self._pending_items: List[tuple] = []
+		self._rendered_upto = 0
+		# Mapas para resolver la seleccion en O(1) sin tree.index (lineal en Tk).
+		self._rows_by_pid: Dict[str, Dict[str, Any]] = {}
+		self._iid_to_row: Dict[str, Dict[str, Any]] = {}
 
 		self._build_ui()
 		self._load_data()
@@ -99,6 +205,7 @@ class PropiedadLista(ttk.Frame):
 		self.entry_search = ttk.Entry(search_frame, textvariable=self.var_search)
 		self.entry_search.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=6)
 		self.entry_search.bind("<Return>", lambda e: self._on_buscar())
+		self.entry_search.bind("<KeyRelease>", lambda e: self._schedule_search())
 		ttk.Button(search_frame, text="Buscar", command=self._on_buscar).pack(side=tk.LEFT, padx=4)
 		ttk.Button(search_frame, text="Limpiar", command=self._on_limpiar_busqueda).pack(side=tk.LEFT)
 
@@ -156,7 +263,10 @@ class PropiedadLista(ttk.Frame):
 		self.tree.column("metros", width=100, anchor=tk.CENTER)
 
 		sb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-		self.tree.configure(yscroll=sb.set)
+		self._sb = sb
+		# El yscrollcommand pasa por un wrapper que va insertando filas a
+		# demanda conforme el scroll (rueda o barra) se acerca al final.
+		self.tree.configure(yscroll=self._on_tree_scroll)
 		self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 		sb.pack(side=tk.RIGHT, fill=tk.Y)
 
@@ -171,9 +281,16 @@ class PropiedadLista(ttk.Frame):
 		self.btn_next = ttk.Button(pager, text="Siguiente", command=self._next_page)
 		self.btn_prev.pack(side=tk.RIGHT)
 		self.btn_next.pack(side=tk.RIGHT, padx=6)
+		self.var_page_size = tk.StringVar(value=str(self.page_size))
+		cb_size = ttk.Combobox(pager, textvariable=self.var_page_size, state="readonly", width=5)
+		cb_size["values"] = ["25", "50", "100"]
+		cb_size.pack(side=tk.RIGHT, padx=(0, 6))
+		cb_size.bind("<<ComboboxSelected>>", lambda e: self._on_page_size())
+		ttk.Label(pager, text="Por pagina:", font=font).pack(side=tk.RIGHT)
 
-		style = ttk.Style()
-		style.configure("Treeview.Heading", foreground=primary)
+		if not PropiedadLista._style_done:
+			ttk.Style().configure("Treeview.Heading", foreground=primary)
+			PropiedadLista._style_done = True
 
 	def _get_filters(self) -> Dict[str, Any]:
 		estado = self.var_estado.get()
@@ -188,10 +305,119 @@ class PropiedadLista(ttk.Frame):
 			filtros["precio_max"] = precio_max
 		return filtros
 
-	def _load_data(self) -> None:
+	def _load_data(self, force: bool = False) -> None:
 		search_text = (self.var_search.get() or "").strip()
 		filtros = self._get_filters()
+		key = (search_text, tuple(sorted(filtros.items())), self.page, self.page_size)
 
+		if not force and key == self._last_key:
+			return
+		# Cualquier nueva carga (aun desde cache) invalida resultados en vuelo.
+		self._load_req += 1
+		if force:
+			# Altas/bajas/ediciones invalidan todo lo cacheado.
+			self._page_cache.clear()
+			self._last_key = None
+		sig = (search_text, key[1])
+		# Navegar entre paginas no cambia el total: solo se vuelve a contar
+		# cuando cambian busqueda/filtros o tras un alta/baja/edicion.
+		total_hint = self.total if (not force and sig == self._filter_sig) else None
+		if force or sig != self._filter_sig:
+			self._filter_sig = sig
+			self._prefetch_gen += 1
+		cached = self._page_cache.get(key)
+		if cached is not None:
+			self._last_key = key
+			self._rows, self.total = cached
+			self._materialize_rows(self._rows)
+			self._render_table()
+			self.after_idle(self._prefetch_neighbors)
+			return
+
+		# La consulta corre en el pool para no congelar el mainloop; el
+		# resultado vuelve al hilo de Tk via after(0, ...).
+		req = self._load_req
+		self.lbl_pager.config(text="Cargando...")
+		self._prefetch_pool.submit(
+			self._fetch_async, req, key, search_text, dict(filtros), self.page, self.page_size, total_hint
+		)
+
+	def _fetch_async(self, req: int, key: tuple, search_text: str, filtros: Dict[str, Any], page: int, page_size: int, total_hint: Optional[int]) -> None:
+		# Corre en el pool: solo backend, nunca widgets de Tk.
+		try:
+			data, total = self._fetch_page(search_text, filtros, page, page_size, total_hint=total_hint)
+		except Exception:
+			LOG.exception("Error consultando pagina de propiedades")
+			data, total = [], 0
+		try:
+			self.after(0, lambda: self._apply_fetch(req, key, data, total))
+		except Exception:
+			# La vista pudo destruirse mientras corria la consulta.
+			pass
+
+	def _apply_fetch(self, req: int, key: tuple, data: List[Dict[str, Any]], total: int) -> None:
+		if req != self._load_req:
+			return
+		self._last_key = key
+		self._page_cache[key] = (data, total)
+		if len(self._page_cache) > 16:
+			self._page_cache.popitem(last=False)
+
+		self.total = total
+		self._rows = data
+		self._materialize_rows(data)
+		self._render_table()
+		# Con la pagina pintada, precargar las vecinas en un idle callback.
+		self.after_idle(self._prefetch_neighbors)
+
+	def _materialize_rows(self, data: List[Dict[str, Any]]) -> None:
+		self._rows_by_pid = {str(p.get("id", "")): p for p in data}
+		self._row_values = {
+			str(p.get("id", "")): (
+				p.get("id", ""),
+				p.get("titulo", ""),
+				p.get("precio", ""),
+				p.get("estado", ""),
+				p.get("ciudad", ""),
+				p.get("metros", ""),
+			)
+			for p in data
+		}
+
+	def _prefetch_neighbors(self) -> None:
+		search_text = (self.var_search.get() or "").strip()
+		filtros = self._get_filters()
+		filt_items = tuple(sorted(filtros.items()))
+		total_pages = max(1, int(math.ceil(self.total / float(self.page_size))))
+		gen = self._prefetch_gen
+		for p in (self.page - 1, self.page + 1):
+			if p < 1 or p > total_pages:
+				continue
+			key = (search_text, filt_items, p, self.page_size)
+			if key in self._page_cache:
+				continue
+			self._prefetch_pool.submit(self._prefetch_page, gen, key, search_text, dict(filtros), p, self.page_size, self.total)
+
+	def _prefetch_page(self, gen: int, key: tuple, search_text: str, filtros: Dict[str, Any], page: int, page_size: int, total_hint: int) -> None:
+		# Corre en el pool: solo consulta y escribe en el dict del cache (ops
+		# atomicas bajo el GIL); nunca toca widgets de Tk.
+		try:
+			resultado = self._fetch_page(search_text, filtros, page, page_size, total_hint=total_hint)
+		except Exception:
+			LOG.exception("Error precargando pagina de propiedades")
+			return
+		if gen != self._prefetch_gen:
+			return
+		self._page_cache[key] = resultado
+		if len(self._page_cache) > 16:
+			self._page_cache.popitem(last=False)
+
+	def _fetch_page(self, search_text: str, filtros: Dict[str, Any], page: int, page_size: int, total_hint: Optional[int] = None) -> tuple:
+		"""Consulta una pagina al backend y normaliza (data, total).
+
+		Con `total_hint` (total ya conocido para los mismos filtros) se omite
+		la llamada a contar_propiedades.
+		"""
 		data: List[Dict[str, Any]] = []
 		total = 0
 
@@ -201,22 +427,30 @@ class PropiedadLista(ttk.Frame):
 			contar = getattr(propiedades_module, "contar_propiedades", None)
 
 			try:
+				# sort/order viajan al backend si su firma los acepta; si no,
+				# _call_with_supported_kwargs los descarta.
 				if search_text and buscar:
 					data = _call_with_supported_kwargs(
 						buscar,
 						texto=search_text,
-						page=self.page,
-						page_size=self.page_size,
+						page=page,
+						page_size=page_size,
 						filtros=filtros,
+						sort=self._sort,
+						order=self._order,
 					)
 				elif listar:
 					data = _call_with_supported_kwargs(
 						listar,
-						page=self.page,
-						page_size=self.page_size,
+						page=page,
+						page_size=page_size,
 						filtros=filtros,
+						sort=self._sort,
+						order=self._order,
 					)
-				if contar:
+				if total_hint is not None:
+					total = total_hint
+				elif contar:
 					total = _call_with_supported_kwargs(
 						contar,
 						texto=search_text,
@@ -229,23 +463,34 @@ class PropiedadLista(ttk.Frame):
 			data = []
 		if not total:
 			total = len(data)
-
-		self.total = total
-		self._rows = data
-		self._render_table()
+		return data, total
 
 	def _render_table(self) -> None:
-		for i in self.tree.get_children():
-			self.tree.delete(i)
-
-		for p in self._rows:
-			pid = p.get("id", "")
-			titulo = p.get("titulo", "")
-			precio = p.get("precio", "")
-			estado = p.get("estado", "")
-			ciudad = p.get("ciudad", "")
-			metros = p.get("metros", "")
-			self.tree.insert("", tk.END, values=(pid, titulo, precio, estado, ciudad, metros))
+		# Diff contra lo ya pintado: filas que siguen en la pagina se
+		# actualizan en sitio (item/move) y solo el delta se borra/inserta,
+		# en lugar de vaciar y reinsertar page_size items por repintado.
+		# Solo la primera tanda visible se pinta aqui; el resto queda en
+		# _pending_items y lo engancha _render_more al hacer scroll.
+		tree = self.tree
+		iids = self._tree_iids
+		nuevos = self._row_values
+
+		viejos = [pid for pid in iids if pid not in nuevos]
+		if viejos:
+			tree.delete(*[iids.pop(pid) for pid in viejos])
+		# Las filas que sobreviven se desenganchan; _render_more las vuelve
+		# a colocar con valores frescos cuando les toca su tanda.
+		restantes = list(iids.values())
+		if restantes:
+			tree.detach(*restantes)
+		sel = tree.selection()
+		if sel:
+			tree.selection_remove(*sel)
+
+		self._iid_to_row.clear()
+		self._pending_items = list(nuevos.items())
+		self._rendered_upto = 0
+		self._render_more(self._VISIBLE_CHUNK)
 
 		total_pages = max(1, int(math.ceil(self.total / float(self.page_size))))
 		self.page = min(max(1, self.page), total_pages)
@@ -253,7 +498,71 @@ class PropiedadLista(ttk.Frame):
 		self.btn_prev.config(state=tk.NORMAL if self.page > 1 else tk.DISABLED)
 		self.btn_next.config(state=tk.NORMAL if self.page < total_pages else tk.DISABLED)
 
+	def _render_more(self, count: int) -> None:
+		tree = self.tree
+		iids = self._tree_iids
+		items = self._pending_items
+		start = self._rendered_upto
+		end = min(len(items), start + count)
+		if start >= end:
+			return
+		# Sin columnas visibles durante la tanda Tk no re-layouta por cada
+		# insert/move; al restaurarlas hace un unico pase.
+		tree.configure(displaycolumns=())
+		try:
+			lote: List[tuple] = []
+			for pos in range(start, end):
+				pid, values = items[pos]
+				iid = iids.get(pid)
+				if iid is None:
+					# Las altas se juntan y se insertan en un solo eval.
+					lote.append((pos, pid, values))
+					continue
+				tree.item(iid, values=values)
+				tree.move(iid, "", pos)
+				row = self._rows_by_pid.get(pid)
+				if row is not None:
+					self._iid_to_row[iid] = row
+			if lote:
+				self._bulk_insert(lote)
+		finally:
+			tree.configure(displaycolumns="#all")
+		self._rendered_upto = end
+
+	def _bulk_insert(self, lote: List[tuple]) -> None:
+		# Cada tree.insert es un cruce Python->Tcl y el cruce domina el costo
+		# por fila; un unico eval inserta toda la tanda y devuelve los iids.
+		tree = self.tree
+		w = str(tree)
+		lineas = ["set __prop_iids {}"]
+		for pos, _pid, values in lote:
+			vals = " ".join(_tcl_quote(v) for v in values)
+			lineas.append(f"lappend __prop_iids [{w} insert {{}} {pos} -values [list {vals}]]")
+		lineas.append("set __prop_iids")
+		res = tree.tk.eval("\n".join(lineas))
+		for (_pos, pid, _values), iid in zip(lote, tree.tk.splitlist(res)):
+			self._tree_iids[pid] = iid
+			row = self._rows_by_pid.get(pid)
+			if row is not None:
+				self._iid_to_row[iid] = row
+
+	def _on_tree_scroll(self, first: str, last: str) -> None:
+		# Tk invoca esto ante cualquier cambio de vista (rueda, barra,
+		# teclado); cerca del final se materializa la siguiente tanda.
+		self._sb.set(first, last)
+		if float(last) >= 0.9 and self._rendered_upto < len(self._pending_items):
+			self._render_more(self._VISIBLE_CHUNK)
+
+	def _schedule_search(self) -> None:
+		# Cada tecla reprograma el query; solo corre el ultimo tras 400 ms.
+		if self._search_after_id is not None:
+			self.after_cancel(self._search_after_id)
+		self._search_after_id = self.after(400, self._on_buscar)
+
 	def _on_buscar(self) -> None:
+		if self._search_after_id is not None:
+			self.after_cancel(self._search_after_id)
+			self._search_after_id = None
 		self.page = 1
 		self._load_data()
 
@@ -269,19 +578,29 @@ class PropiedadLista(ttk.Frame):
 		sel = self.tree.selection()
 		if not sel:
 			return None
-		idx = self.tree.index(sel[0])
-		if idx < 0 or idx >= len(self._rows):
-			return None
-		return self._rows[idx]
+		return self._iid_to_row.get(sel[0])
+
+	def _abrir_form(self, mode: str, propiedad: Optional[Dict[str, Any]] = None) -> None:
+		# Un solo PropiedadForm oculto por vista: construir los tres tabs del
+		# modal es el costo dominante de abrirlo y se paga una vez.
+		dlg = self._form_dlg
+		if dlg is None or not dlg.winfo_exists():
+			dlg = PropiedadForm(master=self.winfo_toplevel(), mode=mode, propiedad=propiedad)
+			dlg._reusable = True
+			self._form_dlg = dlg
+		else:
+			dlg.reset(mode, propiedad)
+			dlg.deiconify()
+		dlg.grab_set()
+		dlg._cerrado.set(False)
+		self.wait_variable(dlg._cerrado)
+		self._load_data(force=True)
 
 	def _on_nuevo(self) -> None:
 		if PropiedadForm is None:
 			messagebox.showerror("Error", "PropiedadForm no disponible.")
 			return
-		dlg = PropiedadForm(master=self.winfo_toplevel(), mode="crear")
-		dlg.grab_set()
-		self.wait_window(dlg)
-		self._load_data()
+		self._abrir_form("crear")
 
 	def _on_editar(self) -> None:
 		prop = self._get_selected()
@@ -291,10 +610,7 @@ class PropiedadLista(ttk.Frame):
 		if PropiedadForm is None:
 			messagebox.showerror("Error", "PropiedadForm no disponible.")
 			return
-		dlg = PropiedadForm(master=self.winfo_toplevel(), mode="editar", propiedad=prop)
-		dlg.grab_set()
-		self.wait_window(dlg)
-		self._load_data()
+		self._abrir_form("editar", prop)
 
 	def _on_ver_detalle(self) -> None:
 		self._on_editar()
@@ -312,11 +628,22 @@ class PropiedadLista(ttk.Frame):
 			return
 		try:
 			eliminar(prop.get("id"))
-			self._load_data()
+			self._load_data(force=True)
 		except Exception:
 			LOG.exception("Error eliminando propiedad")
 			messagebox.showerror("Error", "No se pudo eliminar la propiedad.")
 
+	def _on_page_size(self) -> None:
+		try:
+			nuevo = int(self.var_page_size.get())
+		except Exception:
+			return
+		if nuevo == self.page_size:
+			return
+		self.page_size = nuevo
+		self.page = 1
+		self._load_data()
+
 	def _prev_page(self) -> None:
 		if self.page > 1:
 			self.page -= 1